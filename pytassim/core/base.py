@@ -39,10 +39,14 @@ class BaseModule(torch.nn.Module):
 
     @staticmethod
     def _view_as_2d(tensor: torch.Tensor) -> torch.Tensor:
+        """
+        Views given tensor as 2D tensor. The tensor is only copied if its
+        strides are incompatible with a view, e.g. for non-contiguous tensors.
+        """
         if len(tensor.shape) < 2:
-            tensor = tensor.view(1, -1)
+            tensor = tensor.reshape(1, -1)
         else:
-            tensor = tensor.view(-1, tensor.shape[-1])
+            tensor = tensor.reshape(-1, tensor.shape[-1])
         return tensor
 
     @staticmethod
@@ -12,7 +12,7 @@
 
 # System modules
 import logging
-from typing import Union, Tuple
+from typing import Union, Tuple, Optional
 
 # External modules
 import torch
@@ -31,14 +31,29 @@ class ETKFModule(BaseModule):
     Module to create ETKF weights based on PyTorch.
     This module estimates weight statistics with given perturbations and
     observations.
+
+    Parameters
+    ----------
+    inf_factor : torch.Tensor or torch.nn.Parameter, optional
+        The prior covariance is inflated with this inflation factor.
+    compute_dtype : torch.dtype or None, optional
+        If specified, the kernel matrices are computed in this dtype (e.g.
+        ``torch.float32``), while the eigendecomposition is accumulated in
+        ``torch.float64``. The weights are returned in the dtype of the given
+        perturbations. Default is None, where no casting is performed.
     """
+    compute_dtype: Optional[torch.dtype]
+
     def __init__(
             self,
             inf_factor: Union[torch.Tensor, torch.nn.Parameter] =
-            torch.tensor(1.0)
+            torch.tensor(1.0),
+            compute_dtype: Optional[torch.dtype] = None
     ):
         super().__init__()
-        self.inf_factor = inf_factor
+        self.register_buffer('inf_factor', None)
+        self.inf_factor = torch.as_tensor(inf_factor)
+        self.compute_dtype = compute_dtype
 
     def __str__(self) -> str:
         return 'ETKFCore({0})'.format(self.inf_factor)
@@ -54,6 +69,32 @@ class ETKFModule(BaseModule):
         k_mat = matrix_product(x, y)
         return k_mat
 
+    def _to_evd_dtype(self, tensor: torch.Tensor) -> torch.Tensor:
+        """
+        Promotes given tensor to double precision for the eigendecomposition
+        if the kernel matrices are computed in a reduced precision.
+        """
+        if self.compute_dtype is not None:
+            tensor = tensor.to(torch.float64)
+        return tensor
+
+    def _decompose_perts(
+            self,
+            normed_perts: torch.Tensor,
+            reg_value: torch.Tensor
+    ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Eigendecomposition of the linear kernel matrix of given perturbations.
+        The (ensemble, ensemble) kernel matrix is computed in the dtype of the
+        perturbations and only this matrix is promoted for the
+        eigendecomposition, such that the costs are independent of the
+        number of observations.
+        """
+        kernel_perts = self._apply_kernel(normed_perts, normed_perts)
+        kernel_perts = self._to_evd_dtype(kernel_perts)
+        evals, evects, evals_inv = evd(kernel_perts, reg_value)
+        return evals, evects, evals_inv
+
     def _estimate_weights(
             self,
             normed_perts: torch.Tensor,
@@ -61,19 +102,25 @@ class ETKFModule(BaseModule):
     ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
         """
         Estimates the weights with set inflation factor, _apply_kernel method
-        and given data.
+        and given data. Leading dimensions of the given data are treated as
+        batch dimensions, e.g. for independent local analyses.
         """
         ens_size = normed_perts.shape[-2]
         reg_value = (ens_size-1) / self.inf_factor
-        kernel_perts = self._apply_kernel(normed_perts, normed_perts)
-        evals, evects, evals_inv = evd(kernel_perts, reg_value)
-        cov_analysed = rev_evd(evals_inv, evects)
+        evals, evects, evals_inv = self._decompose_perts(
+            normed_perts, reg_value
+        )
+        square_root_einv = ((ens_size - 1) * evals_inv).sqrt()
+        rev_mats = rev_evd(
+            torch.stack([evals_inv, square_root_einv], dim=-2),
+            evects.unsqueeze(-3)
+        )
+        cov_analysed = rev_mats[..., 0, :, :]
+        w_perts = rev_mats[..., 1, :, :]
 
         kernel_obs = self._apply_kernel(normed_perts, normed_obs)
-        w_mean = torch.mm(cov_analysed, kernel_obs)
-
-        square_root_einv = ((ens_size - 1) * evals_inv).sqrt()
-        w_perts = rev_evd(square_root_einv, evects)
+        kernel_obs = self._to_evd_dtype(kernel_obs)
+        w_mean = torch.matmul(cov_analysed, kernel_obs)
         return w_mean, w_perts, cov_analysed
 
     def forward(
@@ -85,19 +132,37 @@ class ETKFModule(BaseModule):
         Get the ensemble weights for given inflation factor, _apply_kernel
         method and data.
         If the perturbations and observations are empty, the inflated prior
-        weights are returned.
+        weights are returned, copied for every analysis of the batch.
+        Perturbations with more than two dimensions, (..., ensemble, obs), are
+        processed as batch of independent analyses with observations of shape
+        (..., obs), such that all analyses are estimated with batched matrix
+        operations.
         """
         self._test_sizes(normed_perts, normed_obs)
+        weights_shape = list(normed_perts.shape[:-1])
+        weights_shape.append(normed_perts.shape[-2])
         if normed_perts.shape[-1] == 0:
             w_mean, w_perts, _ = self._get_prior_weights(
                 normed_perts
             )
             w_perts = w_perts * torch.sqrt(self.inf_factor)
         else:
-            normed_perts = self._view_as_2d(normed_perts)
-            normed_obs = self._view_as_2d(normed_obs)
+            out_dtype = normed_perts.dtype
+            if normed_perts.dim() > 2:
+                normed_obs = normed_obs.reshape(
+                    weights_shape[:-2] + [-1, normed_obs.shape[-1]]
+                )
+            else:
+                normed_perts = self._view_as_2d(normed_perts)
+                normed_obs = self._view_as_2d(normed_obs)
+            if self.compute_dtype is not None:
+                normed_perts = normed_perts.to(self.compute_dtype)
+                normed_obs = normed_obs.to(self.compute_dtype)
             w_mean, w_perts, _ = self._estimate_weights(
                 normed_perts, normed_obs
             )
+            w_mean = w_mean.to(out_dtype)
+            w_perts = w_perts.to(out_dtype)
         weights = w_mean + w_perts
+        weights = weights.expand(weights_shape).contiguous()
         return weights
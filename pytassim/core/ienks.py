@@ -12,14 +12,15 @@
 
 # System modules
 import logging
-from typing import Union, Tuple
+from typing import Union, Tuple, Optional
 
 # External modules
 import torch
 
 # Internal modules
 from .base import BaseModule
-from .utils import svd, rev_svd, matrix_product, diagonal_add
+from .utils import evd, rev_evd, svd, rev_svd, matrix_product, \
+    diagonal_add
 
 
 logger = logging.getLogger(__name__)
@@ -50,29 +51,46 @@ class IEnKSTransformModule(BaseModule):
             weights: torch.Tensor,
             ens_size: int
     ) -> Tuple[torch.Tensor, torch.Tensor]:
-        weights_deviation = diagonal_add(weights, -1.)
-        weights_mean = weights_deviation.mean(dim=1, keepdim=True)
+        weights_mean = weights.mean(dim=-1, keepdim=True) - 1. / ens_size
         weights_perts = weights - weights_mean
         return weights_mean, weights_perts
 
+    @staticmethod
+    def _get_w_prec(
+            u: torch.Tensor,
+            s_inv: torch.Tensor,
+            ens_size: int
+    ) -> torch.Tensor:
+        w_prec = rev_svd(u, s_inv.square() * (ens_size - 1), u)
+        return w_prec
+
+    @staticmethod
+    def _get_w_perts_inv(
+            u: torch.Tensor,
+            s_inv: torch.Tensor,
+            v: torch.Tensor
+    ) -> Optional[torch.Tensor]:
+        w_perts_inv = rev_svd(u, s_inv, v).transpose(-1, -2)
+        return w_perts_inv
+
     def _decompose_weights(
             self,
             weights: torch.Tensor,
             ens_size: int,
-    ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    ) -> Tuple[torch.Tensor, Optional[torch.Tensor], torch.Tensor]:
         w_mean, w_perts = self._split_weights(weights, ens_size)
         u, s, v = svd(w_perts)
         s_inv = 1 / s
-        s_prec = s_inv.square()
-        w_perts_inv = rev_svd(u, s_inv, v).transpose(-1, -2)
-        w_prec = rev_svd(u, s_prec, u) * (ens_size - 1)
+        w_prec = self._get_w_prec(u, s_inv, ens_size)
+        w_perts_inv = self._get_w_perts_inv(u, s_inv, v)
         return w_mean, w_perts_inv, w_prec
 
     def _get_dh_dw(
             self,
             normed_perts: torch.Tensor,
-            weights_perts_inv: torch.Tensor
+            weights_perts_inv: Optional[torch.Tensor]
     ) -> torch.Tensor:
+        assert weights_perts_inv is not None
         dh_dw = torch.matmul(weights_perts_inv, normed_perts)
         return dh_dw
 
@@ -83,10 +101,16 @@ class IEnKSTransformModule(BaseModule):
             normed_obs: torch.Tensor,
             ens_size: int
     ) -> torch.Tensor:
-        dlobs_dh = -normed_obs
-        grad_obs = matrix_product(dh_dw, dlobs_dh)
-        grad_back = (ens_size - 1) * w_mean
-        grad = grad_back + grad_obs
+        # Background and observational gradient are fused into one product
+        if dh_dw.dim() == 2:
+            grad = torch.addmm(
+                w_mean, dh_dw, normed_obs.t(), beta=ens_size-1, alpha=-1
+            )
+        else:
+            grad = torch.baddbmm(
+                w_mean, dh_dw, normed_obs.transpose(-1, -2),
+                beta=ens_size-1, alpha=-1
+            )
         return grad
 
     def _update_covariance(
@@ -98,11 +122,14 @@ class IEnKSTransformModule(BaseModule):
         new_prec = matrix_product(dh_dw, dh_dw)
         new_prec = diagonal_add(new_prec, ens_size-1.)
         updated_prec = (1-self.tau) * w_prec + self.tau * new_prec
-        u, s, v = svd(updated_prec, reg_value=0.0)
-        s_inv = 1 / s
-        weights_cov = rev_svd(u, s_inv, v)
-        s_perts = (s_inv * (ens_size - 1)).sqrt()
-        weights_perts = rev_svd(u, s_perts, v)
+        _, evects, evals_inv = evd(updated_prec)
+        evals_perts = (evals_inv * (ens_size - 1)).sqrt()
+        rev_mats = rev_evd(
+            torch.stack([evals_inv, evals_perts], dim=-2),
+            evects.unsqueeze(-3)
+        )
+        weights_cov = rev_mats[..., 0, :, :]
+        weights_perts = rev_mats[..., 1, :, :]
         return weights_cov, weights_perts
 
     def _update_weights(
@@ -129,15 +156,16 @@ class IEnKSTransformModule(BaseModule):
             normed_perts: torch.Tensor,
             normed_obs: torch.Tensor
     ) -> torch.Tensor:
+        if normed_perts.shape[-1] == 0 and normed_obs.shape[-1] == 0:
+            return self._view_as_2d(weights)
         self._test_sizes(normed_perts, normed_obs)
         weights = self._view_as_2d(weights)
-        if normed_perts.shape[-1] > 0:
-            normed_perts = self._view_as_2d(normed_perts)
-            normed_obs = self._view_as_2d(normed_obs)
-            w_mean, w_perts = self._update_weights(
-                weights, normed_perts, normed_obs
-            )
-            weights = w_mean + w_perts
+        normed_perts = self._view_as_2d(normed_perts)
+        normed_obs = self._view_as_2d(normed_obs)
+        w_mean, w_perts = self._update_weights(
+            weights, normed_perts, normed_obs
+        )
+        weights = w_mean + w_perts
         return weights
 
 
@@ -165,10 +193,22 @@ class IEnKSBundleModule(IEnKSTransformModule):
             repr(self.epsilon), repr(self.tau)
         )
 
+    @staticmethod
+    def _get_w_perts_inv(
+            u: torch.Tensor,
+            s_inv: torch.Tensor,
+            v: torch.Tensor
+    ) -> Optional[torch.Tensor]:
+        """
+        The bundle version approximates the sensitivities by finite
+        differences and does not need the inverted weight perturbations.
+        """
+        return None
+
     def _get_dh_dw(
             self,
             normed_perts: torch.Tensor,
-            weights_perts_inv: torch.Tensor
+            weights_perts_inv: Optional[torch.Tensor]
     ) -> torch.Tensor:
         dh_dw = normed_perts / self.epsilon
         return dh_dw
@@ -12,7 +12,7 @@
 
 # System modules
 import logging
-from typing import Type, Union, Iterable, Tuple
+from typing import Type, Union, Iterable, Tuple, Optional
 
 # External modules
 import torch
@@ -39,14 +39,18 @@ class KETKFModule(ETKFModule):
         The prior covariance is inflated with this inflation factor. This
         inflation factor is also a type of l2-regularization for the Gaussian
         processes and specifies the uncertainty of the prior ensemble weights.
+    compute_dtype : torch.dtype or None, optional
+        If specified, the kernel matrices are computed in this dtype, while
+        the eigendecomposition is accumulated in double precision.
     """
     def __init__(
             self,
             kernel: BaseKernel,
             inf_factor: Union[torch.Tensor, torch.nn.Parameter] =
-            torch.tensor(1.0)
+            torch.tensor(1.0),
+            compute_dtype: Optional[torch.dtype] = None
     ):
-        super().__init__(inf_factor)
+        super().__init__(inf_factor, compute_dtype)
         self.add_module('kernel', kernel)
 
     def __str__(self):
@@ -71,10 +75,11 @@ class KETKFModule(ETKFModule):
         Estimate the ensemble weights with set kernel and inflation factor, and
         given perturbations and observations.
         """
-        ens_size = normed_perts.shape[0]
+        ens_size = normed_perts.shape[-2]
         reg_value = (ens_size-1) / self.inf_factor
 
         k_perts = self._apply_kernel(normed_perts, normed_perts)
+        k_perts = self._to_evd_dtype(k_perts)
         k_partial_mean = torch.mean(k_perts, dim=-1, keepdim=True)
         k_partial_mean = k_partial_mean - torch.mean(k_partial_mean, dim=-2,
                                                      keepdim=True)
@@ -82,13 +87,17 @@ class KETKFModule(ETKFModule):
                                                 keepdim=True) - k_partial_mean
 
         evals, evects, evals_inv = evd(k_perts_centered, reg_value)
-        cov_analysed = rev_evd(evals_inv, evects)
+        square_root_einv = ((ens_size - 1) * evals_inv).sqrt()
+        rev_mats = rev_evd(
+            torch.stack([evals_inv, square_root_einv], dim=-2),
+            evects.unsqueeze(-3)
+        )
+        cov_analysed = rev_mats[..., 0, :, :]
+        w_perts = rev_mats[..., 1, :, :]
 
         k_obs = self._apply_kernel(normed_perts, normed_obs)
+        k_obs = self._to_evd_dtype(k_obs)
         k_obs_centered = k_obs - torch.mean(k_obs, dim=-2, keepdim=True)
         k_obs_centered = k_obs_centered - k_partial_mean
-        w_mean = torch.mm(cov_analysed, k_obs_centered)
-
-        square_root_einv = ((ens_size - 1) * evals_inv).sqrt()
-        w_perts = rev_evd(square_root_einv, evects)
+        w_mean = torch.matmul(cov_analysed, k_obs_centered)
         return w_mean, w_perts, cov_analysed
@@ -26,6 +26,7 @@ logger = logging.getLogger(__name__)
 def evd(
         tensor: torch.Tensor,
         reg_value: float = 0.,
+        cpu_size: int = 32
 ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
     """
     Performs eigendecomposition of a symmetric hermitian tensor. The eigenvalues
@@ -34,27 +35,38 @@ def evd(
 
     Parameters
     ----------
-    tensor : :py:class:`torch.Tensor` (nx, nx)
+    tensor : :py:class:`torch.Tensor` (..., nx, nx)
         This tensor is eigen decomposed. The values of the nearest positive
-        semidefinit matrix to this tensor are returned.
+        semidefinit matrix to this tensor are returned. Leading dimensions
+        are decomposed as batch of matrices.
     reg_value : float, optional
         This regularization value is added to the eigenvalues and represents
         a regularization of the matrix diagonal. The regularization is
         deactivated with the default value of 0.
+    cpu_size : int, optional
+        CUDA tensors with at most this number of rows are decomposed on the
+        CPU, where small decompositions are faster than the launch overhead
+        of the GPU solver. The results are moved back to the device of the
+        given tensor. Default is 32.
 
     Returns
     -------
-    evals : :py:class:`torch.Tensor` (nx)
+    evals : :py:class:`torch.Tensor` (..., nx)
         The eigenvalues of the nearest positive semidefinit matrix to the
         given tensor. The regularization value is already added to these
         eigenvalues.
-    evects : :py:class:`torch.Tensor` (nx, nx)
+    evects : :py:class:`torch.Tensor` (..., nx, nx)
         The estimated eigenvectors based on given tensor.
-    evals_inv : :py:class:`torch.Tensor` (nx)
+    evals_inv : :py:class:`torch.Tensor` (..., nx)
         The inverted eigenvalues of the nearest positive semidefinit matrix
         to the given tensor.
     """
-    evals, evects = torch.symeig(tensor, eigenvectors=True, upper=False)
+    if tensor.is_cuda and tensor.shape[-1] <= cpu_size:
+        evals, evects = torch.linalg.eigh(tensor.cpu(), UPLO='L')
+        evals = evals.to(tensor.device)
+        evects = evects.to(tensor.device)
+    else:
+        evals, evects = torch.linalg.eigh(tensor, UPLO='L')
     evals = evals.clamp(min=0)
     evals = evals + reg_value
     evals_inv = 1 / evals
@@ -77,25 +89,30 @@ def rev_evd(
 
     Parameters
     ----------
-    evals : :py:class:`torch.Tensor` (nx)
-        These eigenvalues are used to recompose the matrix.
-    evects : :py:class:`torch.Tensor` (nx, nx)
-        These eigenvectors are used to recompose the matrix.
+    evals : :py:class:`torch.Tensor` (..., nx)
+        These eigenvalues are used to recompose the matrix. Leading
+        dimensions are treated as stack of eigenvalues, which share the same
+        eigenvectors, such that several matrices are composed in one batched
+        matrix product.
+    evects : :py:class:`torch.Tensor` (..., nx, nx)
+        These eigenvectors are used to recompose the matrix. Leading
+        dimensions have to be broadcastable to the leading dimensions of
+        given eigenvalues.
 
     Returns
     -------
-    rev_mat : :py:class:`torch.Tensor` (nx, nx)
+    rev_mat : :py:class:`torch.Tensor` (..., nx, nx)
         The recomposed matrix based on given eigenvalues and eigenvectors.
     """
-    diag_flat_evals = torch.diag_embed(evals)
-    rev_mat = torch.mm(evects, diag_flat_evals)
-    rev_mat = torch.mm(rev_mat, evects.t())
+    scaled_evects = evects * evals.unsqueeze(-2)
+    rev_mat = torch.matmul(scaled_evects, evects.transpose(-1, -2))
     return rev_mat
 
 
 def svd(
         tensor: torch.Tensor,
-        reg_value: float = 0.0
+        reg_value: float = 0.0,
+        cpu_size: int = 32
 ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
     """
     Performs singular value decomposition of a tensor. The regularization
@@ -109,6 +126,9 @@ def svd(
         This regularization value is added to the singular values and represents
         a regularization of the matrix diagonal. The regularization is
         deactivated with the default value of 0.
+    cpu_size : int, optional
+        CUDA tensors whose smallest matrix dimension is at most this size
+        are decomposed on the CPU, see also :py:func:`evd`. Default is 32.
 
     Returns
     -------
@@ -119,7 +139,14 @@ def svd(
     v : :py:class:`torch.Tensor`
         The decomposed right singular vector.
     """
-    u, s, v = torch.svd(tensor)
+    min_size = min(tensor.shape[-2], tensor.shape[-1])
+    if tensor.is_cuda and min_size <= cpu_size:
+        u, s, v = torch.svd(tensor.cpu())
+        u = u.to(tensor.device)
+        s = s.to(tensor.device)
+        v = v.to(tensor.device)
+    else:
+        u, s, v = torch.svd(tensor)
     s = s + reg_value
     return u, s, v
 
@@ -134,11 +161,13 @@ def rev_svd(
 
     Parameters
     ----------
-    u : :py:class:`torch.Tensor`
+    u : :py:class:`torch.Tensor` (..., m, k)
         The decomposed left singular vector.
-    s : :py:class:`torch.Tensor`
-        The decomposed singular values with added regularization value.
-    v : :py:class:`torch.Tensor`
+    s : :py:class:`torch.Tensor` (..., k)
+        The decomposed singular values with added regularization value. The
+        singular values are folded into the columns of ``u``, such that no
+        diagonal matrix is constructed.
+    v : :py:class:`torch.Tensor` (..., n, k)
         The decomposed right singular vector.
 
     Returns
@@ -146,7 +175,7 @@ def rev_svd(
     composed_tensor : :py:class:`torch.Tensor`
         The recomposed tensor from given ``u``, ``s``, and ``v``.
     """
-    composed_tensor = torch.matmul(u * s, v.transpose(-1, -2))
+    composed_tensor = torch.matmul(u * s.unsqueeze(-2), v.transpose(-1, -2))
     return composed_tensor
 
 
@@ -26,16 +26,18 @@
 # System modules
 import logging
 import abc
+import threading
 import warnings
 import time
 import datetime
-from typing import Union, Iterable, Tuple, Any, List
+from typing import Union, Iterable, Tuple, Any, List, Callable
 
 # External modules
 import xarray as xr
 import pandas as pd
 import torch
 import numpy as np
+import dask.array
 
 # Internal modules
 from pytassim.state import StateError
@@ -85,23 +87,105 @@ class BaseAssimilation(object):
         with numpy array.
         The bridged module function will returned the ensemble weights as numpy
         array with the same dtype as the first argument to the wrapped module.
+        On the GPU, every calling thread issues its copies and computations
+        on its own CUDA stream, such that concurrently processed chunks can
+        overlap.
 
         Returns
         -------
         wrapped_module : func
             This is the bridged module.
         """
+        return self._bridge_module(self.core_module)
+
+    def _bridge_module(self, core_module: Callable) -> Callable:
+        """
+        Bridges given torch callable to work with numpy arrays as described
+        in :py:attr:`module`.
+        """
         def wrapped_module(*args):
-            torch_args = [
-                torch.from_numpy(arg).to(device=self.device, dtype=self.dtype)
-                for arg in args
-            ]
-            torch_weights = self.core_module(*torch_args)
-            torch_weights = torch_weights.cpu().detach()
-            weights = torch_weights.numpy().astype(args[0].dtype)
+            stream = self._get_transfer_stream() if self.gpu else None
+            with torch.cuda.stream(stream):
+                torch_args = [
+                    self._array_to_tensor(arg, buffer_id=k)
+                    for k, arg in enumerate(args)
+                ]
+                torch_weights = core_module(*torch_args)
+                torch_weights = torch_weights.detach().cpu()
+            weights = torch_weights.numpy().astype(args[0].dtype, copy=False)
             return weights
         return wrapped_module
 
+    def _get_transfer_local(self) -> threading.local:
+        """
+        Thread-local storage for the CUDA stream and the page-locked host
+        buffers of the numpy bridge. dask may call the bridged module from
+        several threads at once, such that every thread gets its own stream
+        and buffers. The storage is only created on the GPU.
+        """
+        transfer_local = getattr(self, '_transfer_local', None)
+        if transfer_local is None:
+            transfer_local = threading.local()
+            self._transfer_local = transfer_local
+        return transfer_local
+
+    def _get_transfer_stream(self) -> torch.cuda.Stream:
+        """
+        Returns the CUDA stream of the calling thread, which is created once
+        and reused for all following calls of this thread.
+        """
+        transfer_local = self._get_transfer_local()
+        stream = getattr(transfer_local, 'stream', None)
+        if stream is None:
+            stream = torch.cuda.Stream(device=self.device)
+            transfer_local.stream = stream
+        return stream
+
+    def _get_pinned_buffer(
+            self,
+            buffer_id: int,
+            shape: torch.Size
+    ) -> torch.Tensor:
+        """
+        Returns a page-locked host tensor with given shape and set dtype.
+        Every thread keeps one flat buffer per argument position, which is
+        only reallocated if it is too small or has another dtype. A buffer
+        can be safely reused by the next call of the same thread, as the
+        previous call waited on its stream for the returned weights.
+        """
+        transfer_local = self._get_transfer_local()
+        buffers = getattr(transfer_local, 'buffers', None)
+        if buffers is None:
+            buffers = {}
+            transfer_local.buffers = buffers
+        numel = int(np.prod(shape))
+        buffer = buffers.get(buffer_id)
+        if buffer is None or buffer.dtype != self.dtype \
+                or buffer.numel() < numel:
+            buffer = torch.empty(numel, dtype=self.dtype, pin_memory=True)
+            buffers[buffer_id] = buffer
+        return buffer[:numel].view(shape)
+
+    def _array_to_tensor(
+            self,
+            array: np.ndarray,
+            buffer_id: int = 0
+    ) -> torch.Tensor:
+        """
+        Converts a given array into a tensor with set dtype on set device.
+        For the GPU, the array is cast into a reused page-locked host buffer,
+        such that the host-to-device copy is asynchronous and does not block
+        the CPU until the copied tensor is used.
+        """
+        tensor = torch.from_numpy(array)
+        if self.gpu:
+            pinned = self._get_pinned_buffer(buffer_id, tensor.shape)
+            pinned.copy_(tensor)
+            tensor = pinned.to(device=self.device, non_blocking=True)
+        else:
+            tensor = tensor.to(dtype=self.dtype)
+        return tensor
+
     @property
     def dtype(self) -> torch.dtype:
         return self._dtype
@@ -137,7 +221,7 @@ class BaseAssimilation(object):
             if not isinstance(obs, xr.Dataset):
                 raise TypeError(
                     '*** Given observation is not a valid ``xarray.Dataset`` '
-                    '***\n{0:s}'.format(obs)
+                    '***\n{0}'.format(type(obs))
                 )
             if not obs.obs.valid:
                 raise ObservationError(
@@ -206,32 +290,84 @@ class BaseAssimilation(object):
         obs_equivalent = []
         filtered_observations = []
         for obs in observations:
+            obs_accessor = obs.obs
             try:
-                obs_equivalent.append(obs.obs.operator(obs, pseudo_state))
+                obs_equivalent.append(
+                    obs_accessor.operator(obs, pseudo_state)
+                )
                 filtered_observations.append(obs)
             except NotImplementedError:
                 pass
         return obs_equivalent, filtered_observations
 
     @staticmethod
+    def _stack_obs_id_index(obs: xr.DataArray) -> pd.MultiIndex:
+        """
+        Creates the ``obs_id`` index for given observations with the time as
+        unix time and the levels of ``obs_grid_1``, without stacking the
+        array itself.
+        """
+        time_index = dtindex_to_total_seconds(obs.indexes['time'])
+        grid_index = obs.indexes['obs_grid_1']
+        if isinstance(grid_index, pd.MultiIndex):
+            grid_names = list(grid_index.names)
+        else:
+            grid_names = ['obs_grid_1']
+        level_values = [np.repeat(time_index.values, len(grid_index))]
+        level_values += [
+            np.tile(grid_index.get_level_values(level).values, len(time_index))
+            for level in range(grid_index.nlevels)
+        ]
+        obs_id_index = pd.MultiIndex.from_arrays(
+            level_values, names=['time'] + grid_names
+        )
+        return obs_id_index
+
     def _stack_obs(
+            self,
             observations: List[xr.DataArray]
     ) -> xr.DataArray:
         stacked_observations = []
         for obs in observations:
-            stacked_obs = obs.assign_coords(
-                time=dtindex_to_total_seconds(obs.indexes['time'])
-            )
-            stacked_obs = stacked_obs.state.stack(
-                    obs_id=('time', 'obs_grid_1')
-            )
+            stacked_obs = obs.transpose(..., 'time', 'obs_grid_1')
             stacked_observations.append(stacked_obs)
-        stacked_observations = xr.concat(stacked_observations, dim='obs_id')
-        unused_coords = [
-            coord_name for coord_name in stacked_observations.coords.keys()
-            if coord_name not in stacked_observations.dims
+        first_obs = stacked_observations[0]
+        stacked_values = [
+            obs.data.reshape(obs.shape[:-2] + (-1, ))
+            for obs in stacked_observations
         ]
-        stacked_observations = stacked_observations.drop_vars(unused_coords)
+        lazy = any(
+            not isinstance(values, np.ndarray) for values in stacked_values
+        )
+        if len(stacked_values) == 1:
+            stacked_values = stacked_values[0]
+            if not lazy:
+                stacked_values = stacked_values.copy()
+            obs_id_index = self._stack_obs_id_index(first_obs)
+        else:
+            if lazy:
+                stacked_values = dask.array.concatenate(
+                    stacked_values, axis=-1
+                )
+            else:
+                stacked_values = np.concatenate(stacked_values, axis=-1)
+            obs_id_index = self._stack_obs_id_index(first_obs).append([
+                self._stack_obs_id_index(obs)
+                for obs in stacked_observations[1:]
+            ])
+        stacked_dims = first_obs.dims[:-2]
+        stacked_coords = {
+            dim: first_obs.indexes[dim] for dim in stacked_dims
+            if dim in first_obs.indexes
+        }
+        stacked_coords['obs_id'] = obs_id_index
+        stacked_observations = xr.DataArray(
+            stacked_values,
+            coords=stacked_coords,
+            dims=stacked_dims + ('obs_id', ),
+            name=first_obs.name,
+            attrs=first_obs.attrs
+        )
         return stacked_observations
 
     @staticmethod
@@ -254,13 +390,14 @@ class BaseAssimilation(object):
     ) -> Tuple[xr.DataArray, xr.DataArray]:
         innovations = []
         ens_obs_perts = []
-        for k, curr_ens in enumerate(ens_obs):
+        for curr_ens, curr_obs in zip(ens_obs, observations):
+            obs_accessor = curr_obs.obs
             curr_mean, curr_perts = curr_ens.state.split_mean_perts(
                 dim='ensemble'
             )
-            curr_innov = observations[k]['observations']-curr_mean
-            curr_innov = observations[k].obs.mul_rcinv(curr_innov)
-            curr_perts = observations[k].obs.mul_rcinv(curr_perts)
+            curr_innov = curr_obs['observations']-curr_mean
+            curr_innov = obs_accessor.mul_rcinv(curr_innov)
+            curr_perts = obs_accessor.mul_rcinv(curr_perts)
             innovations.append(curr_innov)
             ens_obs_perts.append(curr_perts)
         innovations = self._stack_obs(innovations)
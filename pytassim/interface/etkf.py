@@ -13,7 +13,7 @@
 # System modules
 import logging
 import abc
-from typing import Union, Iterable, List
+from typing import Union, Iterable, List, Optional
 
 # External modules
 import xarray as xr
@@ -62,6 +62,11 @@ class ETKF(FilterAssimilation):
         Indicator if the weight estimation should be done on either GPU (True)
         or CPU (False): Default is None. For small models, estimation of the
         weights on CPU is faster than on GPU!.
+    compute_dtype : torch.dtype or None, optional
+        If specified, the kernel matrices of the weight estimation are
+        computed in this dtype (e.g. ``torch.float32``), while the
+        eigendecomposition is accumulated in ``torch.float64``. Default is
+        None, where no casting is performed.
     """
     def __init__(
             self,
@@ -69,12 +74,14 @@ class ETKF(FilterAssimilation):
             smoother: bool = False,
             gpu: bool = False,
             pre_transform: Union[None, Iterable[BaseTransformer]] = None,
-            post_transform: Union[None, Iterable[BaseTransformer]] = None
+            post_transform: Union[None, Iterable[BaseTransformer]] = None,
+            compute_dtype: Optional[torch.dtype] = None
     ):
         super().__init__(smoother=smoother, gpu=gpu,
                          pre_transform=pre_transform,
                          post_transform=post_transform)
         self.inf_factor = inf_factor
+        self.compute_dtype = compute_dtype
 
     def __str__(self):
         return 'Global ETKF(rho={0})'.format(str(self.inf_factor))
@@ -90,7 +97,42 @@ class ETKF(FilterAssimilation):
     def inf_factor(self, new_factor):
         if isinstance(new_factor, (float, int)):
             new_factor = torch.tensor(new_factor, dtype=self.dtype)
-        self._core_module = ETKFModule(inf_factor=new_factor)
+        core_module = getattr(self, '_core_module', None)
+        if core_module is None:
+            self._core_module = ETKFModule(inf_factor=new_factor)
+        else:
+            self._set_core_inf_factor(core_module, new_factor)
+
+    @property
+    def compute_dtype(self) -> Optional[torch.dtype]:
+        return self._compute_dtype
+
+    @compute_dtype.setter
+    def compute_dtype(self, new_dtype: Optional[torch.dtype]):
+        self._compute_dtype = new_dtype
+        self._core_module.compute_dtype = new_dtype
+
+    @staticmethod
+    def _set_core_inf_factor(
+            core_module: torch.nn.Module,
+            new_factor: Union[torch.Tensor, torch.nn.Parameter]
+    ):
+        """
+        Sets given inflation factor in place at given core module. A
+        registered parameter cannot be overwritten by a plain tensor, such
+        that the parameter is removed and the new factor is registered as
+        buffer instead.
+        """
+        replace_param = (
+            isinstance(core_module.inf_factor, torch.nn.Parameter)
+            and not isinstance(new_factor, torch.nn.Parameter)
+            and not isinstance(core_module, torch.jit.ScriptModule)
+        )
+        if replace_param:
+            del core_module.inf_factor
+            core_module.register_buffer('inf_factor', new_factor)
+        else:
+            core_module.inf_factor = new_factor
 
     def estimate_weights(
             self,
@@ -78,6 +78,9 @@ class IEnKSTransform(VarAssimilation):
         innovations, ens_obs_perts = self._get_obs_space_variables(
             ens_obs, filtered_obs
         )
+
+        self._core_module = torch.jit.script(self._core_module)
+
         weights = xr.apply_ufunc(
             self.module,
             weights,
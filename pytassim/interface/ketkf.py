@@ -12,7 +12,7 @@
 
 # System modules
 import logging
-from typing import Union, Iterable
+from typing import Union, Iterable, Optional
 
 # External modules
 import torch
@@ -65,6 +65,11 @@ class KETKF(ETKF):
         Indicator if the weight estimation should be done on either GPU (True)
         or CPU (False): Default is None. For small models, estimation of the
         weights on CPU is faster than on GPU!.
+    compute_dtype : torch.dtype or None, optional
+        If specified, the kernel matrices of the weight estimation are
+        computed in this dtype (e.g. ``torch.float32``), while the
+        eigendecomposition is accumulated in ``torch.float64``. Default is
+        None, where no casting is performed.
     """
     def __init__(
             self,
@@ -73,7 +78,8 @@ class KETKF(ETKF):
             smoother: bool = False,
             gpu: bool = False,
             pre_transform: Union[None, Iterable[BaseTransformer]] = None,
-            post_transform: Union[None, Iterable[BaseTransformer]] = None
+            post_transform: Union[None, Iterable[BaseTransformer]] = None,
+            compute_dtype: Optional[torch.dtype] = None
     ):
         self._core_module = KETKFModule(kernel=kernel)
         super().__init__(
@@ -81,7 +87,8 @@ class KETKF(ETKF):
             smoother=smoother,
             gpu=gpu,
             pre_transform=pre_transform,
-            post_transform=post_transform
+            post_transform=post_transform,
+            compute_dtype=compute_dtype
         )
         self.kernel = kernel
 
@@ -95,18 +102,6 @@ class KETKF(ETKF):
             repr(self.inf_factor), repr(self.kernel)
         )
 
-    @property
-    def inf_factor(self):
-        return self._core_module.inf_factor
-
-    @inf_factor.setter
-    def inf_factor(self, new_factor):
-        if isinstance(new_factor, (float, int)):
-            new_factor = torch.tensor(new_factor, dtype=self.dtype)
-        self._core_module = KETKFModule(
-            inf_factor=new_factor, kernel=self.kernel
-        )
-
     @property
     def kernel(self):
         return self._core_module.kernel
@@ -114,6 +109,11 @@ class KETKF(ETKF):
     @kernel.setter
     def kernel(self, new_kernel):
         new_kernel.to(dtype=self.dtype, device=self.device)
-        self._core_module = KETKFModule(
-            kernel=new_kernel, inf_factor=self.inf_factor
-        )
+        if isinstance(self._core_module, torch.jit.ScriptModule):
+            self._core_module = KETKFModule(
+                kernel=new_kernel,
+                inf_factor=self.inf_factor,
+                compute_dtype=self.compute_dtype
+            )
+        else:
+            self._core_module.kernel = new_kernel
@@ -13,7 +13,7 @@
 # System modules
 import logging
 import abc
-from typing import Union, Iterable, List, Callable
+from typing import Union, Iterable, List, Callable, Optional
 
 # External modules
 import xarray as xr
@@ -68,6 +68,11 @@ class LETKF(DomainLocalizedMixin, ETKF):
         Indicator if the weight estimation should be done on either GPU (True)
         or CPU (False): Default is None. For small models, estimation of the
         weights on CPU is faster than on GPU!.
+    compute_dtype : torch.dtype or None, optional
+        If specified, the kernel matrices of the weight estimation are
+        computed in this dtype (e.g. ``torch.float32``), while the
+        eigendecomposition is accumulated in ``torch.float64``. Default is
+        None, where no casting is performed.
     """
     def __init__(
             self,
@@ -77,11 +82,13 @@ class LETKF(DomainLocalizedMixin, ETKF):
             gpu: bool = False,
             pre_transform: Union[None, Iterable[BaseTransformer]] = None,
             post_transform: Union[None, Iterable[BaseTransformer]] = None,
-            chunksize: int = 10,
+            chunksize: int = 16,
+            compute_dtype: Optional[torch.dtype] = None
     ):
         super().__init__(inf_factor=inf_factor, smoother=smoother, gpu=gpu,
                          pre_transform=pre_transform,
-                         post_transform=post_transform)
+                         post_transform=post_transform,
+                         compute_dtype=compute_dtype)
         self.localization = localization
         self.chunksize = chunksize
 
@@ -112,12 +119,11 @@ class LETKF(DomainLocalizedMixin, ETKF):
         self._core_module = torch.jit.script(self._core_module)
 
         weights = xr.apply_ufunc(
-            self.localized_module,
+            self.batched_localized_module,
             state_info,
             ens_obs_perts,
             innovations,
             input_core_dims=[['id_names'], ['ensemble', 'obs_id'], ['obs_id']],
-            vectorize=True,
             dask='parallelized',
             output_core_dims=[['ensemble', 'ensemble_new']],
             output_dtypes=[float],
@@ -81,7 +81,7 @@ class LocalizedIEnKSTransform(IEnKSTransform, DomainLocalizedMixin):
         self._core_module = torch.jit.script(self._core_module)
 
         weights = xr.apply_ufunc(
-            self.localized_module,
+            self.vmapped_localized_module,
             state_info,
             weights,
             ens_obs_perts,
@@ -92,14 +92,10 @@ class LocalizedIEnKSTransform(IEnKSTransform, DomainLocalizedMixin):
                 ['ensemble', 'obs_id'],
                 ['obs_id']
             ],
-            vectorize=True,
             dask='parallelized',
             output_core_dims=[['ensemble', 'ensemble_new']],
             output_dtypes=[float],
-            kwargs={
-                'obs_info': obs_info,
-                'args_to_skip': (0, )
-            }
+            kwargs={'obs_info': obs_info}
         )
         weights = weights.assign_coords(state_id=state_index)
         weights = weights.unstack('state_id')
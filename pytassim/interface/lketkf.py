@@ -12,7 +12,7 @@
 
 # System modules
 import logging
-from typing import Union, Iterable
+from typing import Union, Iterable, Optional
 
 # External modules
 import torch
@@ -73,6 +73,11 @@ class LKETKF(KETKF, DomainLocalizedMixin):
         Indicator if the weight estimation should be done on either GPU (True)
         or CPU (False): Default is None. For small models, estimation of the
         weights on CPU is faster than on GPU!.
+    compute_dtype : torch.dtype or None, optional
+        If specified, the kernel matrices of the weight estimation are
+        computed in this dtype (e.g. ``torch.float32``), while the
+        eigendecomposition is accumulated in ``torch.float64``. Default is
+        None, where no casting is performed.
     """
     estimate_weights = LETKF.estimate_weights
 
@@ -85,7 +90,8 @@ class LKETKF(KETKF, DomainLocalizedMixin):
             gpu: bool = False,
             pre_transform: Union[None, Iterable[BaseTransformer]] = None,
             post_transform: Union[None, Iterable[BaseTransformer]] = None,
-            chunksize: int = 10,
+            chunksize: int = 16,
+            compute_dtype: Optional[torch.dtype] = None
     ):
         super().__init__(
             kernel=kernel,
@@ -94,6 +100,7 @@ class LKETKF(KETKF, DomainLocalizedMixin):
             gpu=gpu,
             pre_transform=pre_transform,
             post_transform=post_transform,
+            compute_dtype=compute_dtype
         )
         self.localization = localization
         self.chunksize = chunksize
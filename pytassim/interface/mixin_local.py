@@ -45,6 +45,84 @@ class DomainLocalizedMixin(object):
             return self.module(*args)
         return wrapper
 
+    @property
+    def batched_localized_module(self):
+        """
+        Bridged module, which estimates the weights for a whole chunk of grid
+        points at once. The localized observations of all grid points within
+        the chunk are stacked into a batch, where observations used by other
+        grid points of the chunk get a zero weight and do not contribute.
+        The core module then estimates all local weights with batched matrix
+        operations instead of one call per grid point. The batch spans the
+        union of all used observations within the chunk, such that its costs
+        grow with the chunk size relative to the localization radius.
+        """
+        def wrapper(grid_info, perts, obs, obs_info=None):
+            n_grid = grid_info.shape[0]
+            if self.localization is None:
+                weights = self.module(perts, obs)
+                return np.broadcast_to(
+                    weights, (n_grid, ) + weights.shape
+                ).copy()
+            lweights, chunk_use = self._get_chunk_lweights(
+                grid_info, obs_info, perts
+            )
+            batched_perts = perts[None, :, chunk_use] * lweights[:, None, :]
+            batched_obs = obs[..., chunk_use] * lweights
+            return self.module(batched_perts, batched_obs)
+        return wrapper
+
+    @property
+    def vmapped_localized_module(self):
+        """
+        Bridged module for core modules, which estimate the weights for a
+        single grid point only and get the prior weights as first argument.
+        The observations are localized as in
+        :py:attr:`batched_localized_module` and the core module is vectorized
+        over the grid points of a chunk with :py:func:`torch.vmap`.
+        """
+        vmapped_module = self._bridge_module(torch.vmap(self.core_module))
+
+        def wrapper(grid_info, weights, perts, obs, obs_info=None):
+            n_grid = grid_info.shape[0]
+            if self.localization is None:
+                lweights = np.ones((n_grid, perts.shape[-1]), dtype=perts.dtype)
+                chunk_use = slice(None)
+            else:
+                lweights, chunk_use = self._get_chunk_lweights(
+                    grid_info, obs_info, perts
+                )
+            batched_weights = np.broadcast_to(
+                weights, (n_grid, ) + weights.shape[-2:]
+            ).copy()
+            batched_perts = perts[..., chunk_use] * lweights[:, None, :]
+            batched_obs = obs[..., chunk_use] * lweights
+            return vmapped_module(batched_weights, batched_perts, batched_obs)
+        return wrapper
+
+    def _get_chunk_lweights(
+            self,
+            grid_info: np.ndarray,
+            obs_info: pd.DataFrame,
+            perts: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Estimates the square root of the localization weights for all grid
+        points of a chunk. Only observations used by at least one grid point
+        of the chunk are kept, observations unused by a single grid point get
+        a zero weight.
+        """
+        lweights = np.zeros((grid_info.shape[0], perts.shape[-1]),
+                            dtype=perts.dtype)
+        for k, curr_grid in enumerate(grid_info):
+            luse, curr_weights = self.localization.localize_obs(
+                curr_grid, obs_info
+            )
+            lweights[k, luse] = np.sqrt(curr_weights[luse])
+        chunk_use = np.any(lweights > 0, axis=0)
+        lweights = lweights[:, chunk_use]
+        return lweights, chunk_use
+
     @staticmethod
     def _extract_obs_information(observations: xr.DataArray) -> pd.DataFrame:
         obs_info = utils.multiindex_to_frame(observations.indexes['obs_id'])
@@ -64,13 +64,20 @@ class TanhKernel(BaseKernel):
         This constant intercept value is used to shift the output of the dot
         product, before the tanh function is applied. The default value of 0
         deactivates shifting.
+    fast : bool, optional
+        If the tanh function should be approximated by the algebraic sigmoid
+        :math:`x / \sqrt{1+x^2}`, which has the same limits and the same
+        slope at zero, but avoids the evaluation of a transcendental
+        function. The default value of False uses the exact tanh.
 
     """
     def __init__(self, coeff: torch.Tensor = torch.tensor(1.),
-                 const: torch.Tensor = torch.tensor(0.)):
+                 const: torch.Tensor = torch.tensor(0.),
+                 fast: bool = False):
         super().__init__()
         self.coeff = coeff
         self.const = const
+        self.fast = fast
 
     def __str__(self) -> str:
         return 'TanhKernel({0}, {1})'.format(
@@ -82,6 +89,9 @@ class TanhKernel(BaseKernel):
 
     def forward(self, x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
         xy = dot_product(x, y)
-        logit = self.coeff * xy + self.const
-        kernel_mat = torch.tanh(logit)
+        logit = torch.addcmul(self.const, self.coeff, xy)
+        if self.fast:
+            kernel_mat = logit * torch.rsqrt(1 + logit * logit)
+        else:
+            kernel_mat = logit.tanh_()
         return kernel_mat
@@ -89,10 +89,17 @@ def distance_matrix(
 
 def euclidean_dist(
         x: torch.Tensor,
-        y: torch.Tensor
+        y: torch.Tensor,
+        exact_size: int = 65536
 ) -> torch.Tensor:
     """
     The euclidean distance defined as squared difference between x and y.
+    For small inputs, the squared differences are computed directly. Larger
+    inputs are expanded into :math:`||x||^2 + ||y||^2 - 2 x^T y`, such that
+    only a matrix product and two norm vectors are needed. To reduce
+    cancellation errors for nearby points, both inputs are centered by the
+    mean of `y` before the expansion. Negative values due to round-off
+    errors are clamped to zero.
 
     Parameters
     ----------
@@ -100,11 +107,26 @@ def euclidean_dist(
         The first input to the kernel.
     y : :py:class:`torch.Tensor` (..., n_samples_y, n_features)
         The second input to the kernel.
+    exact_size : int, optional
+        If the tensor of all pairwise differences has at most this number of
+        elements, the distance is computed directly from the differences.
+        Default is 65536.
 
     Returns
     -------
     dist : :py:class:`torch.Tensor` (..., n_samples_x, n_samples_y)
         Euclidean distance between x and y.
     """
-    dist = distance_matrix(x, y, norm=2.).pow(2)
+    if x.numel() * y.shape[-2] <= exact_size:
+        diff = x.unsqueeze(-2) - y.unsqueeze(-3)
+        dist = diff.pow(2).sum(dim=-1)
+    else:
+        y_mean = y.mean(dim=-2, keepdim=True)
+        x = x - y_mean
+        y = y - y_mean
+        x_norm = x.pow(2).sum(dim=-1, keepdim=True)
+        y_norm = y.pow(2).sum(dim=-1, keepdim=True)
+        xy = torch.matmul(x, y.transpose(-1, -2))
+        dist = x_norm + y_norm.transpose(-1, -2) - 2 * xy
+        dist = dist.clamp(min=0)
     return dist
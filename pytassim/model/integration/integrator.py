@@ -29,6 +29,13 @@ import abc
 from typing import Callable, Any
 
 # External modules
+import numpy as np
+
+try:
+    import numba
+    from numba.extending import is_jitted
+except ImportError:  # pragma: no cover
+    numba = None
 
 # Internal modules
 
@@ -97,6 +104,34 @@ class BaseIntegrator(object):
         else:
             self._dt = new_dt
 
+    @property
+    def numba_model(self) -> bool:
+        """
+        If the set model is compiled with :py:func:`numba.njit`. The
+        integration is then dispatched to :py:meth:`_calc_inc_numba` for
+        :py:class:`numpy.ndarray` states. This is always False if numba is
+        not installed.
+        """
+        return numba is not None and is_jitted(self.model)
+
+    def _calc_inc_numba(self, state: np.ndarray) -> np.ndarray:
+        """
+        This hook estimates the increment for a numba-compiled model. It can
+        be overwritten by integrators to run their whole step in compiled
+        code. As default, it falls back to :py:meth:`_calc_increment`.
+
+        Parameters
+        ----------
+        state : :py:class:`numpy.ndarray`
+            This state is used to estimate the increment.
+
+        Returns
+        -------
+        est_inc : :py:class:`numpy.ndarray`
+            This increment is estimated by this integration object.
+        """
+        return self._calc_increment(state)
+
     @abc.abstractmethod
     def _calc_increment(self, state: Any) -> Any:
         """
@@ -131,8 +166,13 @@ class BaseIntegrator(object):
         int_state : any
             This state is integrated by given model. The integrated state is the
             initial state plus an increment estimated based on this integrator
-            and set model.
+            and set model. If set model is compiled with numba and given
+            state is a :py:class:`numpy.ndarray`, the increment is estimated
+            with :py:meth:`_calc_inc_numba`.
         """
-        estimated_inc = self._calc_increment(state)
+        if self.numba_model and isinstance(state, np.ndarray):
+            estimated_inc = self._calc_inc_numba(state)
+        else:
+            estimated_inc = self._calc_increment(state)
         int_state = state + estimated_inc
         return int_state
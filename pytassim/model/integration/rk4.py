@@ -28,14 +28,39 @@ import logging
 from typing import Callable, Any
 
 # External modules
+import numpy as np
 
 # Internal modules
-from .integrator import BaseIntegrator
+from .integrator import BaseIntegrator, numba
 
 
 logger = logging.getLogger(__name__)
 
 
+def _rk4_step_func(model: Callable) -> Callable:
+    """
+    Creates a Runge-Kutta stepper for given model. The model is closed over,
+    such that the stepper can be compiled as a whole by numba.
+    """
+    def stepper(state, steps, weights, dt):
+        averaged_slope = np.zeros_like(state)
+        curr_slope = np.zeros_like(state)
+        for k in range(steps.shape[0]):
+            model_state = state + curr_slope * steps[k]
+            curr_slope = model(model_state)
+            averaged_slope += weights[k] * curr_slope
+        return averaged_slope * dt
+    return stepper
+
+
+def _rk4_numba_stepper(model: Callable) -> Callable:
+    """
+    Compiles a Runge-Kutta stepper for given numba-compiled model, such that
+    the whole step runs in compiled code.
+    """
+    return numba.njit(_rk4_step_func(model))
+
+
 class RK4Integrator(BaseIntegrator):
     """
     RK4Integrator uses a Runge-Kutta fourth-order method to integrate given
@@ -62,6 +87,7 @@ class RK4Integrator(BaseIntegrator):
         self.weights = [1, 2, 2, 1]
         self._weights_sum = sum(self.weights)
         self._weights = [w / self._weights_sum for w in self.weights]
+        self._numba_stepper = None
 
     def __str__(self) -> str:
         return 'RK4Integrator(model={0:s}, dt={1})'.format(str(self.model),
@@ -89,6 +115,40 @@ class RK4Integrator(BaseIntegrator):
         est_inc = self._estimate_slope(state) * self.dt
         return est_inc
 
+    def _calc_inc_numba(self, state: np.ndarray) -> np.ndarray:
+        """
+        This method estimates the increment with a numba-compiled Runge-Kutta
+        stepper, which calls set numba-compiled model without returning to
+        Python between the single steps. The stepper is compiled once per
+        set model and stored on this integrator. Integer states are promoted
+        to floating point, such that the sub-steps and weights are not
+        truncated.
+
+        Parameters
+        ----------
+        state : :py:class:`numpy.ndarray`
+            This state is used to estimate the slope.
+
+        Returns
+        -------
+        est_inc : :py:class:`numpy.ndarray`
+            This increment is estimated by multiplying estimated slope with
+            set time step.
+        """
+        if self._numba_stepper is None or \
+                self._numba_stepper[0] is not self.model:
+            self._numba_stepper = (
+                self.model, _rk4_numba_stepper(self.model)
+            )
+        stepper = self._numba_stepper[1]
+        calc_dtype = np.result_type(state.dtype, float)
+        est_inc = stepper(
+            state.astype(calc_dtype, copy=False),
+            np.asarray(self.steps, dtype=calc_dtype),
+            np.asarray(self._weights, dtype=calc_dtype), self.dt
+        )
+        return est_inc
+
     def _estimate_slope(self, state: Any) -> Any:
         """
         This method estimates the slope based on given state. This slope is
@@ -31,8 +31,8 @@ from inspect import signature
 # External modules
 import xarray as xr
 from xarray import register_dataset_accessor
-import dask.array as da
 import numpy as np
+import torch
 
 # Internal modules
 from .utilities import lazy_property
@@ -122,20 +122,10 @@ class Observation(object):
         valid_dims : bool
             If the dimensions are available.
         """
-        necessary_dims = [
-            'time', 'obs_grid_1'
-        ]
-        keys_avail = all(
-            True if d in tuple(self.ds.dims.keys()) else False
-            for d in necessary_dims
-        )
-
-        all_dims = necessary_dims + ['obs_grid_2']
-        no_auxiliary = all(
-            True if d in all_dims else False for d in tuple(self.ds.dims.keys())
-        )
-
-        valid_dims = keys_avail and no_auxiliary
+        necessary_dims = {'time', 'obs_grid_1'}
+        all_dims = necessary_dims | {'obs_grid_2'}
+        ds_dims = set(self.ds.dims.keys())
+        valid_dims = necessary_dims <= ds_dims <= all_dims
         return valid_dims
 
     @property
@@ -201,8 +191,8 @@ class Observation(object):
         checked_shape = valid_shape == self.ds['covariance'].shape
 
         try:
-            checked_coord_values = self.ds['obs_grid_1'].to_index().equals(
-                self.ds['obs_grid_2'].to_index()
+            checked_coord_values = np.array_equal(
+                self.ds['obs_grid_1'].values, self.ds['obs_grid_2'].values
             )
         except KeyError:
             checked_coord_values = False
@@ -222,10 +212,10 @@ class Observation(object):
             If the two :py:class:`~xarray.DataArray`s are valid.
         """
         try:
-            if self.correlated:
-                valid_array = self._valid_obs and self._valid_cov_corr
-            else:
-                valid_array = self._valid_obs and self._valid_cov_uncorr
+            valid_array = self._valid_obs and (
+                self._valid_cov_corr if self.correlated
+                else self._valid_cov_uncorr
+            )
         except KeyError:
             valid_array = False
         return valid_array
@@ -240,37 +230,54 @@ class Observation(object):
         valid_ds : bool
             If set :py:class:`~xarray.Dataset` is valid.
         """
-        valid_ds = False
-        if self._valid_dims and self._valid_arrays:
-            valid_ds = True
+        valid_ds = self._valid_dims and self._valid_arrays
         return valid_ds
 
     @lazy_property('r_cinv')
     def _uncorr_chol_inverse(self) -> np.ndarray:
-        cov_square_root = da.sqrt(self.ds['covariance'])
-        cov_chol_inv = 1 / cov_square_root
+        cov_chol_inv = 1 / np.sqrt(self.ds['covariance'])
         return cov_chol_inv
 
     @staticmethod
-    def _single_corr_chol_inv(array: xr.DataArray) -> xr.DataArray:
-        chol = np.linalg.cholesky(array.data)
-        chol_inv = np.linalg.inv(chol)
-        chol_inv = array.copy(data=chol_inv)
-        return chol_inv
+    def _tril_inverse(chol_decomp: np.ndarray) -> np.ndarray:
+        """
+        Inverts lower triangular matrices with a triangular solve against
+        the identity matrix, which exploits the triangular structure instead
+        of a general LU-based inversion. Leading dimensions are treated as
+        stack of independent matrices and solved in a single batched call.
+        """
+        chol_tensor = torch.as_tensor(chol_decomp)
+        identity = torch.eye(
+            chol_tensor.shape[-1], dtype=chol_tensor.dtype
+        ).expand(chol_tensor.shape)
+        chol_inv = torch.linalg.solve_triangular(
+            chol_tensor, identity, upper=False
+        )
+        return chol_inv.numpy()
 
     @lazy_property('r_cinv')
     def _corr_chol_inverse(self):
-        if 'time' in self.ds['covariance'].dims:
-            cov_chol_inv = []
-            for curr_t in range(len(self.ds['covariance'].time)):
-                curr_cov = self.ds['covariance'][curr_t]
-                curr_chol_inv = self._single_corr_chol_inv(curr_cov)
-                cov_chol_inv.append(curr_chol_inv)
-            cov_chol_inv = xr.concat(cov_chol_inv, dim='time')
+        """
+        The inverse of the Cholesky factor of the correlated covariance. A
+        time-dependent covariance is decomposed as one stack of
+        (time, obs_grid_1, obs_grid_2) matrices, such that the blocks are
+        factorised in a single call and the result is assembled only once.
+        If all time blocks are identical, only the first block is decomposed
+        and its inverse is repeated along the time axis.
+        """
+        cov_values = self.ds['covariance'].values
+        identical_blocks = (
+            cov_values.ndim > 2 and np.all(cov_values == cov_values[:1])
+        )
+        if identical_blocks:
+            chol_decomp = np.linalg.cholesky(cov_values[0])
+            cov_chol_inv = np.broadcast_to(
+                self._tril_inverse(chol_decomp), cov_values.shape
+            ).copy()
         else:
-            chol_decomp = np.linalg.cholesky(self.ds['covariance'].data)
-            cov_chol_inv = np.linalg.inv(chol_decomp)
-            cov_chol_inv = self.ds['covariance'].copy(data=cov_chol_inv)
+            chol_decomp = np.linalg.cholesky(cov_values)
+            cov_chol_inv = self._tril_inverse(chol_decomp)
+        cov_chol_inv = self.ds['covariance'].copy(data=cov_chol_inv)
         return cov_chol_inv
 
     def _corr_normalize(self, value):
@@ -12,6 +12,7 @@
 
 # System modules
 import logging
+import itertools
 from typing import Any
 
 # External modules
@@ -92,11 +93,13 @@ def index_to_array(
     else:
         raw_index_array = np.atleast_1d(index.values)
     if isinstance(raw_index_array[0], tuple):
-        shape = (-1, len(raw_index_array[0]))
+        n_levels = len(raw_index_array[0])
+        index_array = np.fromiter(
+            itertools.chain.from_iterable(raw_index_array), dtype=float,
+            count=len(raw_index_array) * n_levels
+        ).reshape(-1, n_levels)
     elif raw_index_array.ndim > 1:
-        shape = raw_index_array.shape
+        index_array = raw_index_array.astype(float, copy=False)
     else:
-        shape = (-1, 1)
-    dtype = ','.join(['float']*shape[-1])
-    index_array = np.array(index, dtype=dtype).view(float).reshape(*shape)
+        index_array = raw_index_array.astype(float, copy=False).reshape(-1, 1)
     return index_array
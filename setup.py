@@ -41,5 +41,13 @@ setup(
 
     packages=find_packages(exclude=['contrib', 'docs', 'tests.*', 'test']),
 
+    install_requires=[
+        'torch>=2.0',
+    ],
+
+    extras_require={
+        'numba': ['numba'],
+    },
+
     test_suite='tests',
 )
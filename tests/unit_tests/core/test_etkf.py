@@ -38,7 +38,7 @@ from pytassim.core.utils import evd, rev_evd
 from pytassim.testing import if_gpu_decorator
 
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
@@ -98,7 +98,10 @@ class TestETKFModule(unittest.TestCase):
         prepared_states = [innov, hx_perts, obs_cov]
         torch_states = [torch.from_numpy(s).float() for s in prepared_states]
         innov, hx_perts, obs_cov = torch_states
-        obs_cinv = torch.cholesky(obs_cov).inverse()
+        obs_chol = torch.linalg.cholesky(obs_cov)
+        obs_cinv = torch.linalg.solve_triangular(
+            obs_chol, torch.eye(obs_chol.shape[-1]), upper=False
+        )
         self.normed_perts = hx_perts @ obs_cinv
         self.normed_obs = (innov @ obs_cinv).view(1, 1)
 
@@ -119,6 +122,12 @@ class TestETKFModule(unittest.TestCase):
         self.assertTrue(weights.is_cuda)
         torch.testing.assert_allclose(cpu_weights, weights.cpu())
 
+    def test_inf_factor_is_registered_as_buffer(self):
+        self.module.inf_factor = torch.tensor(1.5)
+        buffers = dict(self.module.named_buffers())
+        self.assertIn('inf_factor', buffers)
+        torch.testing.assert_allclose(buffers['inf_factor'], 1.5)
+
     def test_inf_factor_can_be_set_as_paramater(self):
         self.module.inf_factor = torch.nn.Parameter(torch.tensor(1.5))
         ret_val = self.module(self.normed_perts, self.normed_obs)
@@ -165,6 +174,24 @@ class TestETKFModule(unittest.TestCase):
         ret_rev = rev_evd(evals, evects)
         torch.testing.assert_allclose(ret_rev, right_rev)
 
+    @if_gpu_decorator
+    def test_evd_small_cuda_tensor_returns_cuda(self):
+        ret_kernel = self.module._apply_kernel(self.normed_perts,
+                                               self.normed_perts)
+        evals, evects, evals_inv = evd(ret_kernel.cuda(), 1)
+        self.assertTrue(evals.is_cuda)
+        self.assertTrue(evects.is_cuda)
+        right_rev = rev_evd(*evd(ret_kernel, 1)[:2])
+        torch.testing.assert_allclose(rev_evd(evals, evects).cpu(), right_rev)
+
+    def test_rev_evd_composes_stacked_evals(self):
+        ret_kernel = self.module._apply_kernel(self.normed_perts,
+                                               self.normed_perts)
+        evals, evects, evals_inv = evd(ret_kernel, 1)
+        ret_rev = rev_evd(torch.stack([evals, evals_inv]), evects)
+        torch.testing.assert_allclose(ret_rev[0], rev_evd(evals, evects))
+        torch.testing.assert_allclose(ret_rev[1], rev_evd(evals_inv, evects))
+
     def test_right_w_eigendecomposition(self):
         ret_prec = self.normed_perts @ self.normed_perts.t()
         evals, evects = np.linalg.eigh(ret_prec)
@@ -232,6 +259,58 @@ class TestETKFModule(unittest.TestCase):
         ret_weights = self.module(normed_perts, normed_obs)
         torch.testing.assert_allclose(ret_weights, prior_perts)
 
+    def test_decompose_perts_equals_evd_of_kernel(self):
+        for n_obs in (50, 3):
+            normed_perts = torch.randn(10, n_obs, dtype=torch.float64)
+            kernel_perts = torch.mm(normed_perts, normed_perts.t())
+            right_evals, _, _ = evd(kernel_perts, 9.)
+            evals, evects, evals_inv = self.module._decompose_perts(
+                normed_perts, torch.tensor(9.)
+            )
+            torch.testing.assert_allclose(
+                evals.sort()[0], right_evals.sort()[0]
+            )
+            torch.testing.assert_allclose(
+                rev_evd(evals - 9., evects), kernel_perts
+            )
+            torch.testing.assert_allclose(evals_inv, 1 / evals)
+
+    def test_compute_dtype_returns_weights_in_input_dtype(self):
+        torch.manual_seed(42)
+        normed_perts = torch.randn(10, 50, dtype=torch.float64)
+        normed_obs = torch.randn(1, 50, dtype=torch.float64)
+        self.module.compute_dtype = torch.float32
+        ret_weights = self.module(normed_perts, normed_obs)
+        self.module.compute_dtype = None
+        right_weights = self.module(normed_perts, normed_obs)
+        self.assertEqual(ret_weights.dtype, torch.float64)
+        torch.testing.assert_allclose(ret_weights, right_weights,
+                                      rtol=1E-5, atol=1E-5)
+
+    def test_batched_weights_equal_single_weights(self):
+        normed_perts = torch.randn(4, 10, 7, dtype=torch.float64)
+        normed_obs = torch.randn(4, 7, dtype=torch.float64)
+        ret_weights = self.module(normed_perts, normed_obs)
+        right_weights = torch.stack([
+            self.module(normed_perts[k], normed_obs[k]) for k in range(4)
+        ])
+        torch.testing.assert_allclose(ret_weights, right_weights)
+
+    def test_batched_weights_returns_prior_for_empty_observations(self):
+        normed_perts = torch.ones(3, 10, 0)
+        normed_obs = torch.ones(3, 0)
+        ret_weights = self.module(normed_perts, normed_obs)
+        prior_perts = torch.eye(10).expand(3, 10, 10)
+        torch.testing.assert_allclose(ret_weights, prior_perts)
+
+    def test_batched_prior_weights_do_not_share_memory(self):
+        normed_perts = torch.ones(3, 10, 0)
+        normed_obs = torch.ones(3, 0)
+        ret_weights = self.module(normed_perts, normed_obs)
+        self.assertTrue(ret_weights.is_contiguous())
+        ret_weights[0] += 1
+        torch.testing.assert_allclose(ret_weights[1], torch.eye(10))
+
     def test_raises_valueerror_if_different_observation_size(self):
         normed_perts = torch.ones(10, 4)
         normed_obs = torch.ones(1, 3)
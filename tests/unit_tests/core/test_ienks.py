@@ -30,7 +30,7 @@ from pytassim.testing.dummy import dummy_obs_operator
 from pytassim.testing.decorators import if_gpu_decorator
 
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
@@ -92,6 +92,14 @@ class TestIEnKSTransformCore(unittest.TestCase):
         recomposed_perts = rev_svd(u, s, v)
         torch.testing.assert_allclose(recomposed_perts, w_perts)
 
+    def test_rev_svd_recomposes_batched_tensors(self):
+        w_perts = torch.stack(
+            [self._construct_weights(10)[2] for _ in range(3)]
+        )
+        u, s, v = svd(w_perts, reg_value=0.0)
+        recomposed_perts = rev_svd(u, s, v)
+        torch.testing.assert_allclose(recomposed_perts, w_perts)
+
     def test_split_weights_splits_prior_correctly(self):
         weights = torch.eye(40)
         splitted_weights = self.module._split_weights(weights, ens_size=40)
@@ -137,6 +145,18 @@ class TestIEnKSTransformCore(unittest.TestCase):
         )
         torch.testing.assert_allclose(ret_gradient, gradient)
 
+    def test_get_gradient_works_batched(self):
+        weights, w_mean, w_perts = self._construct_weights(10)
+        dh_dw = torch.matmul(w_perts.inverse(), self.normed_perts)
+        gradient = self.module._get_gradient(
+            w_mean, dh_dw, self.normed_obs, ens_size=10
+        )
+        ret_gradient = self.module._get_gradient(
+            w_mean.expand(3, -1, -1), dh_dw.expand(3, -1, -1),
+            self.normed_obs.expand(3, -1, -1), ens_size=10
+        )
+        torch.testing.assert_allclose(ret_gradient, gradient.expand(3, -1, -1))
+
     def test_update_covariance_updates_covariance(self):
         self.module.tau = torch.tensor(0.5)
         weights, w_mean, w_perts = self._construct_weights(10)
@@ -228,9 +248,9 @@ class TestIEnKSTransformCore(unittest.TestCase):
         curr_prec = curr_cov.inverse()
         new_prec = dh_dw @ dh_dw.t() + torch.eye(10) * 9
         updated_prec = 0.5 * curr_prec + 0.5 * new_prec
-        u, s, v = torch.svd(updated_prec)
-        updated_cov = torch.matmul(u/s, v.t())
-        updated_perts = torch.matmul(u * (9/s).sqrt(), v.t())
+        s, u = torch.linalg.eigh(updated_prec)
+        updated_cov = torch.matmul(u/s, u.t())
+        updated_perts = torch.matmul(u * (9/s).sqrt(), u.t())
         w_delta = - 0.5 * torch.matmul(updated_cov, gradient)
         updated_mean = w_mean + w_delta
         ret_mean, ret_perts = self.module._update_weights(
@@ -247,6 +267,18 @@ class TestIEnKSTransformCore(unittest.TestCase):
         )
         torch.testing.assert_allclose(ret_weights, weights)
 
+    def test_update_weights_returns_same_shape_if_len_0(self):
+        weights = self._construct_weights(10)[0]
+        right_weights = self.module(
+            weights.view(1, 10, 10), self.normed_perts, self.normed_obs
+        )
+        ret_weights = self.module(
+            weights.view(1, 10, 10), self.normed_perts[..., :0],
+            self.normed_obs[:, :0]
+        )
+        self.assertEqual(ret_weights.shape, right_weights.shape)
+        self.assertEqual(ret_weights.shape, torch.Size((10, 10)))
+
     def test_update_weights_returns_updated_weights(self):
         weights = self._construct_weights(10)[0]
         updated_weights = self.module._update_weights(
@@ -258,10 +290,31 @@ class TestIEnKSTransformCore(unittest.TestCase):
         )
         torch.testing.assert_allclose(ret_weights, updated_weights)
 
+    def test_update_weights_works_with_non_contiguous(self):
+        weights = self._construct_weights(10)[0]
+        non_contiguous_perts = self.normed_perts.view(2, 5, -1).transpose(0, 1)
+        self.assertFalse(non_contiguous_perts.is_contiguous())
+        right_weights = self.module(
+            weights, non_contiguous_perts.contiguous(), self.normed_obs
+        )
+        ret_weights = self.module(
+            weights, non_contiguous_perts, self.normed_obs
+        )
+        torch.testing.assert_allclose(ret_weights, right_weights)
+
+    def test_view_as_2d_does_not_copy_contiguous(self):
+        tensor = self.normed_perts.view(2, 5, -1)
+        ret_tensor = self.module._view_as_2d(tensor)
+        self.assertEqual(ret_tensor.data_ptr(), tensor.data_ptr())
+        self.assertEqual(ret_tensor.shape, (10, tensor.shape[-1]))
+
     def test_update_weights_tests_obs_perts_size(self):
         with self.assertRaises(ValueError):
             self.module(torch.eye(10), self.normed_perts[:, :5],
                         self.normed_obs)
+        with self.assertRaises(ValueError):
+            self.module(torch.eye(10), self.normed_perts[:, :0],
+                        self.normed_obs)
 
     @if_gpu_decorator
     def test_update_weights_uses_cuda(self):
@@ -281,6 +334,15 @@ class TestIEnKSTransformCore(unittest.TestCase):
     def test_module_can_be_compiled(self):
         _ = torch.jit.script(self.module)
 
+    def test_compiled_module_returns_same_weights(self):
+        weights, _, _ = self._construct_weights(10)
+        right_weights = self.module(weights, self.normed_perts,
+                                    self.normed_obs)
+        compiled_module = torch.jit.script(self.module)
+        ret_weights = compiled_module(weights, self.normed_perts,
+                                      self.normed_obs)
+        torch.testing.assert_allclose(ret_weights, right_weights)
+
 
 class TestIEnKSBundleCore(TestIEnKSTransformCore):
     def setUp(self) -> None:
@@ -289,6 +351,18 @@ class TestIEnKSBundleCore(TestIEnKSTransformCore):
             tau=torch.tensor(1.0)
         )
 
+    def test_decomposed_weights_estimates_perts_inverse_and_covariance(self):
+        weights, w_mean, w_perts = self._construct_weights(40)
+        w_cov = w_perts @ w_perts.t() / 39
+        u, s, v = torch.svd(w_cov)
+        w_prec = torch.matmul(u * s.pow(-1), v.t())
+
+        decomposed_weights = self.module._decompose_weights(weights, 40)
+        torch.testing.assert_allclose(decomposed_weights[0], w_mean)
+        self.assertIsNone(decomposed_weights[1])
+        torch.testing.assert_allclose(decomposed_weights[2], w_prec,
+                                      rtol=1E-4, atol=1E-4)
+
     def test_dh_dw_returns_right_matrices(self):
         self.module.epsilon = torch.tensor(1E-3)
         dh_dw = self.normed_perts / self.module.epsilon
@@ -307,9 +381,9 @@ class TestIEnKSBundleCore(TestIEnKSTransformCore):
         curr_prec = curr_cov.inverse()
         new_prec = dh_dw @ dh_dw.t() + torch.eye(10) * 9
         updated_prec = 0.5 * curr_prec + 0.5 * new_prec
-        u, s, v = torch.svd(updated_prec)
-        updated_cov = torch.matmul(u/s, v.t())
-        updated_perts = torch.matmul(u * (9/s).sqrt(), v.t())
+        s, u = torch.linalg.eigh(updated_prec)
+        updated_cov = torch.matmul(u/s, u.t())
+        updated_perts = torch.matmul(u * (9/s).sqrt(), u.t())
         w_delta = - 0.5 * torch.matmul(updated_cov, gradient)
         updated_mean = w_mean + w_delta
         ret_mean, ret_perts = self.module._update_weights(
@@ -41,7 +41,7 @@ from pytassim import kernels
 from pytassim.testing import dummy_obs_operator, if_gpu_decorator
 
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
@@ -137,6 +137,16 @@ class TestKETKFWeightsModule(unittest.TestCase):
         ret_weight_stats = self.module(self.normed_perts, self.normed_obs)
         torch.testing.assert_allclose(ret_weight_stats, weights)
 
+    def test_batched_weights_equal_single_weights(self):
+        self.module = KETKFModule(kernel=kernels.RBFKernel(gamma=10))
+        normed_perts = torch.stack([self.normed_perts, self.normed_perts*2])
+        normed_obs = torch.stack([self.normed_obs, self.normed_obs*2])
+        ret_weights = self.module(normed_perts, normed_obs)
+        right_weights = torch.stack([
+            self.module(normed_perts[k], normed_obs[k]) for k in range(2)
+        ])
+        torch.testing.assert_allclose(ret_weights, right_weights)
+
 
 if __name__ == '__main__':
     unittest.main()
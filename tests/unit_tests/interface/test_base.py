@@ -34,6 +34,7 @@ import xarray as xr
 import numpy as np
 import pandas as pd
 import torch
+import dask.array
 
 # Internal modules
 from pytassim.interface.base import BaseAssimilation
@@ -41,13 +42,15 @@ from pytassim.utilities.pandas import multiindex_to_frame, \
     dtindex_to_total_seconds
 from pytassim.state import StateError
 from pytassim.observation import ObservationError
-from pytassim.testing import dummy_obs_operator
+from pytassim.testing import dummy_obs_operator, if_gpu_decorator
 
 
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
+STATE_PATH = os.path.join(DATA_PATH, 'test_state.nc')
+OBS_PATH = os.path.join(DATA_PATH, 'test_single_obs.nc')
 
 
 class NewAssimilation(BaseAssimilation):
@@ -56,13 +59,16 @@ class NewAssimilation(BaseAssimilation):
 
 
 class TestBaseAssimilation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._state = xr.open_dataarray(STATE_PATH).load()
+        cls._obs = xr.open_dataset(OBS_PATH).load()
+
     def setUp(self):
         self.rnd = np.random.RandomState(42)
         self.algorithm = NewAssimilation()
-        state_path = os.path.join(DATA_PATH, 'test_state.nc')
-        self.state = xr.open_dataarray(state_path)
-        obs_path = os.path.join(DATA_PATH, 'test_single_obs.nc')
-        self.obs = xr.open_dataset(obs_path)
+        self.state = self._state.copy(deep=True)
+        self.obs = self._obs.copy(deep=True)
 
     def test_dtype_returns_private_dtype(self):
         self.algorithm._dtype = torch.int
@@ -88,11 +94,35 @@ class TestBaseAssimilation(unittest.TestCase):
         self.algorithm.gpu = False
         self.assertEqual(self.algorithm.device, torch.device('cpu'))
 
-    def test_validate_state_calls_valid_from_state(self):
-        with patch('pytassim.state.ModelState.valid',
-                   new_callable=PropertyMock) as mock_state_valid:
-            self.algorithm._validate_state(self.state)
-        mock_state_valid.assert_called_once()
+    def test_array_to_tensor_uses_dtype_and_device(self):
+        array = self.rnd.normal(size=(10, 40)).astype(np.float32)
+        tensor = self.algorithm._array_to_tensor(array)
+        self.assertEqual(tensor.dtype, self.algorithm.dtype)
+        self.assertEqual(tensor.device, self.algorithm.device)
+        np.testing.assert_equal(tensor.numpy(), array.astype(np.float64))
+
+    @if_gpu_decorator
+    def test_array_to_tensor_copies_to_gpu(self):
+        self.algorithm.gpu = True
+        array = self.rnd.normal(size=(10, 40))
+        tensor = self.algorithm._array_to_tensor(array)
+        self.assertTrue(tensor.is_cuda)
+        np.testing.assert_equal(tensor.cpu().numpy(), array)
+
+    @if_gpu_decorator
+    def test_array_to_tensor_reuses_pinned_buffer(self):
+        self.algorithm.gpu = True
+        array = self.rnd.normal(size=(10, 40))
+        self.algorithm._array_to_tensor(array)
+        buffer = self.algorithm._get_pinned_buffer(0, torch.Size((10, 40)))
+        small_array = self.rnd.normal(size=(10, 20))
+        tensor = self.algorithm._array_to_tensor(small_array)
+        torch.cuda.synchronize()
+        small_buffer = self.algorithm._get_pinned_buffer(
+            0, torch.Size((10, 20))
+        )
+        self.assertEqual(small_buffer.data_ptr(), buffer.data_ptr())
+        np.testing.assert_equal(tensor.cpu().numpy(), small_array)
 
     def test_validate_state_raises_state_error_if_not_valid(self):
         self.state = self.state.rename(var_name='var_test')
@@ -103,12 +133,6 @@ class TestBaseAssimilation(unittest.TestCase):
         with self.assertRaises(TypeError):
             self.algorithm._validate_state(self.state.values)
 
-    def test_validate_single_obs_calls_valid_from_obs(self):
-        with patch('pytassim.observation.Observation.valid',
-                   new_callable=PropertyMock) as mock_obs_valid:
-            self.algorithm._validate_observations((self.obs, ))
-            mock_obs_valid.assert_called_once()
-
     def test_validate_single_obs_raises_obs_error(self):
         self.obs = self.obs.rename(obs_grid_1='obs_grid')
         with self.assertRaises(ObservationError) as _:
@@ -123,14 +147,14 @@ class TestBaseAssimilation(unittest.TestCase):
         returned_time = self.algorithm._get_analysis_time(
             self.state, analysis_time=valid_time
         )
-        np.testing.assert_equal(valid_time, returned_time)
+        self.assertEqual(valid_time, returned_time)
 
     def test_get_analysis_time_return_latest_time_if_none(self):
         valid_time = pd.to_datetime(self.state.time[-1].to_pandas())
         returned_time = self.algorithm._get_analysis_time(
             self.state, analysis_time=None
         )
-        np.testing.assert_equal(valid_time, returned_time)
+        self.assertEqual(valid_time, returned_time)
 
     def test_get_analysis_returns_nearest_time_if_not_valid(self):
         valid_time = pd.to_datetime(self.state.time[0].to_pandas())
@@ -138,7 +162,7 @@ class TestBaseAssimilation(unittest.TestCase):
             returned_time = self.algorithm._get_analysis_time(
                 self.state, analysis_time='1991'
             )
-        np.testing.assert_equal(valid_time, returned_time)
+        self.assertEqual(valid_time, returned_time)
 
     def test_get_analysis_time_works_for_given_array(self):
         analysis_time = self.state.time[:2].values
@@ -184,6 +208,28 @@ class TestBaseAssimilation(unittest.TestCase):
         returned_stacked_obs = self.algorithm._stack_obs(obs_list)
         xr.testing.assert_identical(stacked_obs, returned_stacked_obs)
 
+    def test_stack_obs_keeps_dask_lazy(self):
+        obs = self.obs['observations']
+        for obs_list in ([obs.chunk()], [obs.chunk(), obs]):
+            with self.subTest(n_obs=len(obs_list)):
+                returned_stacked_obs = self.algorithm._stack_obs(obs_list)
+                self.assertIsInstance(
+                    returned_stacked_obs.data, dask.array.Array
+                )
+                right_stacked_obs = self.algorithm._stack_obs(
+                    [curr_obs.load() for curr_obs in obs_list]
+                )
+                xr.testing.assert_identical(
+                    returned_stacked_obs.compute(), right_stacked_obs
+                )
+
+    def test_stack_obs_copies_single_obs(self):
+        obs = self.obs['observations']
+        returned_stacked_obs = self.algorithm._stack_obs([obs])
+        self.assertFalse(
+            np.shares_memory(returned_stacked_obs.values, obs.values)
+        )
+
     def test_stack_obs_removes_unused_coords(self):
         stacked_obs = self.obs['observations'].assign_coords(
             time=dtindex_to_total_seconds(self.obs.indexes['time'])
@@ -332,5 +378,38 @@ class TestBaseAssimilation(unittest.TestCase):
         xr.testing.assert_identical(analysis, ret_analysis)
 
 
+class TestBaseAssimilationValidation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._state = xr.open_dataarray(STATE_PATH).load()
+        cls._obs = xr.open_dataset(OBS_PATH).load()
+        # Mocks are kept in a dict, as a PropertyMock as class attribute
+        # would act as descriptor itself.
+        cls._valid_mocks = {}
+        valid_targets = {
+            'state': 'pytassim.state.ModelState.valid',
+            'obs': 'pytassim.observation.Observation.valid'
+        }
+        for name, target in valid_targets.items():
+            patcher = patch(target, new_callable=PropertyMock)
+            cls._valid_mocks[name] = patcher.start()
+            cls.addClassCleanup(patcher.stop)
+
+    def setUp(self):
+        self.algorithm = NewAssimilation()
+        self.state = self._state.copy(deep=True)
+        self.obs = self._obs.copy(deep=True)
+        for mock_valid in self._valid_mocks.values():
+            mock_valid.reset_mock()
+
+    def test_validate_state_calls_valid_from_state(self):
+        self.algorithm._validate_state(self.state)
+        self._valid_mocks['state'].assert_called_once()
+
+    def test_validate_single_obs_calls_valid_from_obs(self):
+        self.algorithm._validate_observations((self.obs, ))
+        self._valid_mocks['obs'].assert_called_once()
+
+
 if __name__ == '__main__':
     unittest.main()
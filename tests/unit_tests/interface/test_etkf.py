@@ -68,10 +68,10 @@ class TestETKF(unittest.TestCase):
         self.state.close()
         self.obs.close()
 
-    def test_inf_factor_sets_core_module(self):
+    def test_inf_factor_updates_core_module_inplace(self):
         old_id = id(self.algorithm._core_module)
         self.algorithm.inf_factor = torch.tensor(3.2)
-        self.assertNotEqual(id(self.algorithm._core_module), old_id)
+        self.assertEqual(id(self.algorithm._core_module), old_id)
         torch.testing.assert_allclose(self.algorithm.core_module.inf_factor,
                                       3.2)
 
@@ -80,6 +80,27 @@ class TestETKF(unittest.TestCase):
         self.algorithm.inf_factor = new_inf_factor
         self.assertEqual(self.algorithm.core_module.inf_factor, new_inf_factor)
 
+    def test_inf_factor_replaces_parameter_with_float(self):
+        module_id = id(self.algorithm.core_module)
+        self.algorithm.inf_factor = torch.nn.Parameter(torch.tensor(1.5))
+        self.algorithm.inf_factor = 2.0
+        self.assertEqual(id(self.algorithm.core_module), module_id)
+        self.assertNotIsInstance(
+            self.algorithm.core_module.inf_factor, torch.nn.Parameter
+        )
+        self.assertEqual(len(list(self.algorithm.core_module.parameters())), 0)
+        torch.testing.assert_allclose(
+            self.algorithm.core_module.inf_factor, 2.0
+        )
+
+    def test_compute_dtype_is_passed_to_core_module(self):
+        self.assertIsNone(self.algorithm.core_module.compute_dtype)
+        algorithm = ETKF(compute_dtype=torch.float32)
+        self.assertEqual(algorithm.compute_dtype, torch.float32)
+        self.assertEqual(algorithm.core_module.compute_dtype, torch.float32)
+        algorithm.compute_dtype = None
+        self.assertIsNone(algorithm.core_module.compute_dtype)
+
     def test_float_inf_factor_gets_converted_into_tensor(self):
         self.algorithm.inf_factor = 3.2
         self.assertIsInstance(
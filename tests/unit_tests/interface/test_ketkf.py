@@ -53,7 +53,7 @@ from pytassim.testing import dummy_obs_operator, if_gpu_decorator
 
 
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
@@ -113,6 +113,34 @@ class TestKETKF(unittest.TestCase):
         self.algorithm.kernel = kernels.GaussKernel()
         self.assertIsInstance(self.algorithm.core_module, KETKFModule)
 
+    def test_inf_factor_replaces_parameter_with_float(self):
+        module_id = id(self.algorithm.core_module)
+        self.algorithm.inf_factor = torch.nn.Parameter(torch.tensor(1.5))
+        self.algorithm.inf_factor = 2.0
+        self.assertEqual(id(self.algorithm.core_module), module_id)
+        self.assertNotIsInstance(
+            self.algorithm.core_module.inf_factor, torch.nn.Parameter
+        )
+        self.assertEqual(len(list(self.algorithm.core_module.parameters())), 0)
+        torch.testing.assert_allclose(
+            self.algorithm.core_module.inf_factor, 2.0
+        )
+
+    def test_inf_factor_updates_module_in_place(self):
+        module_id = id(self.algorithm.core_module)
+        self.algorithm.inf_factor = 1.5
+        self.assertEqual(id(self.algorithm.core_module), module_id)
+        torch.testing.assert_allclose(
+            self.algorithm.core_module.inf_factor, 1.5
+        )
+
+    def test_kernel_updates_module_in_place(self):
+        module_id = id(self.algorithm.core_module)
+        new_kernel = kernels.GaussKernel()
+        self.algorithm.kernel = new_kernel
+        self.assertEqual(id(self.algorithm.core_module), module_id)
+        self.assertEqual(self.algorithm.core_module.kernel, new_kernel)
+
     def test_ketkf_linear_kernel_same_result_as_etkf(self):
         ana_time = self.state.time[-1].values
         obs_tuple = (self.obs, self.obs.copy())
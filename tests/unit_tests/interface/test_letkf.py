@@ -67,6 +67,15 @@ class TestLETKF(unittest.TestCase):
         xr.testing.assert_allclose(letkf_analysis, etkf_analysis,
                                    rtol=1E-10, atol=1E-10)
 
+    def test_compute_dtype_is_kept_in_scripted_module(self):
+        obs_tuple = (self.obs, self.obs)
+        right_analysis = self.algorithm.assimilate(self.state, obs_tuple)
+        self.algorithm.compute_dtype = torch.float32
+        ret_analysis = self.algorithm.assimilate(self.state, obs_tuple)
+        self.assertEqual(self.algorithm.compute_dtype, torch.float32)
+        xr.testing.assert_allclose(ret_analysis, right_analysis,
+                                   rtol=1E-5, atol=1E-5)
+
     def test_update_state_returns_valid_state(self):
         obs_tuple = (self.obs, self.obs)
         analysis = self.algorithm.update_state(
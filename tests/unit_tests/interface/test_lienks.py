@@ -134,6 +134,27 @@ class TestLIEnKSTransform(unittest.TestCase):
         lienks_weights = lienks_weights.mean(['grid', 'time'])
         xr.testing.assert_allclose(lienks_weights, ienks_weights)
 
+    def test_vmapped_module_equals_localized_module(self):
+        self.algorithm.localization = GaspariCohn(
+            (3.,), dist_func=lambda x, y: (np.abs(x[0] - y[:, 0]),)
+        )
+        grid_info = np.arange(5.)[:, None]
+        obs_info = np.linspace(0, 8, 6)[:, None]
+        weights = np.eye(5) + rnd.normal(scale=0.1, size=(5, 5, 5))
+        perts = rnd.normal(size=(5, 6))
+        obs = rnd.normal(size=(6, ))
+        right_weights = np.stack([
+            self.algorithm.localized_module(
+                grid_info[k], weights[k], perts, obs, obs_info=obs_info,
+                args_to_skip=(0, )
+            )
+            for k in range(5)
+        ])
+        ret_weights = self.algorithm.vmapped_localized_module(
+            grid_info, weights, perts, obs, obs_info=obs_info
+        )
+        np.testing.assert_allclose(ret_weights, right_weights)
+
     def test_lienks_with_linear_equals_letkf(self):
         def dist_func(x, y):
             diff = x - y
@@ -46,7 +46,7 @@ from pytassim.testing import dummy_obs_operator, if_gpu_decorator
 
 
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
@@ -106,6 +106,22 @@ class TestLKETKF(unittest.TestCase):
         self.algorithm.kernel = kernels.GaussKernel()
         self.assertIsInstance(self.algorithm.core_module, KETKFModule)
 
+    def test_kernel_rebuilds_scripted_module(self):
+        ana_time = self.state.time[-1].values
+        obs_tuple = (self.obs, self.obs.copy())
+        self.algorithm.inf_factor = 1.5
+        self.algorithm.assimilate(self.state, obs_tuple, None, ana_time)
+        self.assertIsInstance(self.algorithm.core_module,
+                              torch.jit.ScriptModule)
+        new_kernel = kernels.GaussKernel()
+        self.algorithm.kernel = new_kernel
+        self.assertIsInstance(self.algorithm.core_module, KETKFModule)
+        self.assertEqual(self.algorithm.kernel, new_kernel)
+        torch.testing.assert_allclose(self.algorithm.inf_factor, 1.5)
+        analysis = self.algorithm.assimilate(self.state, obs_tuple, None,
+                                             ana_time)
+        self.assertFalse(np.any(np.isnan(analysis.values)))
+
     def test_ketkf_linear_kernel_same_result_as_etkf(self):
         ana_time = self.state.time[-1].values
         obs_tuple = (self.obs, self.obs.copy())
@@ -35,7 +35,7 @@ from pytassim.kernels import base_kernels
 from pytassim.kernels.scale import ScaleKernel
 
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
@@ -36,7 +36,7 @@ from pytassim.kernels.linear import LinearKernel
 from pytassim.kernels.utils import dot_product
 
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
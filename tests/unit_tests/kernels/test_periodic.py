@@ -39,7 +39,7 @@ from pytassim.kernels.periodic import PeriodicKernel
 from pytassim.kernels.utils import distance_matrix
 
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
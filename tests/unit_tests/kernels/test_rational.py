@@ -38,7 +38,7 @@ from pytassim.kernels.rational import RationalKernel
 from pytassim.kernels.utils import euclidean_dist
 
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
@@ -35,10 +35,10 @@ from torch.autograd import grad
 
 # Internal modules
 from pytassim.kernels.rbf import RBFKernel, GaussKernel
-from pytassim.kernels.utils import euclidean_dist, distance_matrix
+from pytassim.kernels.utils import euclidean_dist
 
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
@@ -65,6 +65,33 @@ class TestGaussKernel(unittest.TestCase):
         ret_dist = euclidean_dist(test_tensor, test_tensor_2)
         torch.testing.assert_allclose(ret_dist, euc_dist)
 
+    def test_euc_dist_non_negative(self):
+        test_tensor = torch.zeros(10, 2).normal_() * 1E4
+        ret_dist = euclidean_dist(test_tensor, test_tensor)
+        self.assertTrue(torch.all(ret_dist >= 0))
+
+    def test_euc_dist_expanded_equals_exact(self):
+        test_tensor = torch.zeros(5, 10, 2).normal_()
+        test_tensor_2 = torch.zeros(5, 3, 2).normal_()
+        right_dist = euclidean_dist(test_tensor, test_tensor_2)
+        ret_dist = euclidean_dist(test_tensor, test_tensor_2, exact_size=0)
+        torch.testing.assert_allclose(ret_dist, right_dist)
+
+    def test_euc_dist_precise_for_near_duplicates(self):
+        test_tensor = torch.zeros(10, 50).normal_() + 1E3
+        test_tensor_2 = test_tensor + torch.zeros(10, 50).normal_() * 1E-2
+        diff = test_tensor.double().unsqueeze(-2) - \
+            test_tensor_2.double().unsqueeze(-3)
+        right_dist = diff.pow(2).sum(dim=-1).float()
+        for exact_size in (65536, 0):
+            with self.subTest(exact_size=exact_size):
+                ret_dist = euclidean_dist(test_tensor, test_tensor_2,
+                                          exact_size=exact_size)
+                torch.testing.assert_allclose(
+                    ret_dist.diagonal(), right_dist.diagonal(),
+                    rtol=1E-3, atol=1E-4
+                )
+
     def test_gauss_kernel_works(self):
         dist = self.tensor.view(10, 2, 1)-self.tensor[:3].t().view(1, 2, 3)
         dist = dist
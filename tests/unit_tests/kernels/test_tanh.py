@@ -38,7 +38,7 @@ from pytassim.kernels.tanh import TanhKernel
 from pytassim.kernels.utils import dot_product
 
 
-logging.basicConfig(level=logging.DEBUG)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
@@ -88,6 +88,22 @@ class TestTanhKernel(unittest.TestCase):
         torch.testing.assert_allclose(self.kernel.coeff.grad, right_grads[0])
         torch.testing.assert_allclose(self.kernel.const.grad, right_grads[1])
 
+    def test_fast_forward_returns_algebraic_sigmoid_of_logit(self):
+        self.kernel.fast = True
+        y_tensor = self.tensor[:2]
+        dot_prod_out = dot_product(self.tensor, y_tensor)
+        logit = self.kernel.coeff * dot_prod_out + self.kernel.const
+        right_out = logit / torch.sqrt(1 + logit.pow(2))
+        kernel_out = self.kernel(self.tensor, y_tensor)
+        torch.testing.assert_allclose(kernel_out, right_out)
+
+    def test_fast_kernel_compilable(self):
+        self.kernel.fast = True
+        orig_value = self.kernel(self.tensor, self.tensor)
+        compiled_kernel = torch.jit.script(self.kernel)
+        compiled_value = compiled_kernel(self.tensor, self.tensor)
+        torch.testing.assert_allclose(compiled_value, orig_value)
+
     def test_kernel_compilable(self):
         orig_value = self.kernel(self.tensor, self.tensor)
         compiled_kernel = torch.jit.script(self.kernel)
@@ -26,6 +26,7 @@ Created for torch-assimilate
 import unittest
 import logging
 import os
+from unittest.mock import patch, PropertyMock
 
 # External modules
 import numpy as np
@@ -33,7 +34,8 @@ import torch
 
 
 # Internal modules
-from pytassim.model.integration.rk4 import RK4Integrator
+from pytassim.model.integration.rk4 import RK4Integrator, _rk4_step_func
+from pytassim.model.integration.integrator import numba
 
 
 logging.basicConfig(level=logging.INFO)
@@ -73,6 +75,58 @@ class TestRK4Integrator(unittest.TestCase):
         right_increment = self.integrator._calc_increment(self.state)
         np.testing.assert_almost_equal(torch_increment.numpy(), right_increment)
 
+    @unittest.skipIf(numba is None, 'numba is not installed!')
+    def test_rk4_numba_equals_python_increment(self):
+        jit_model = numba.njit(dummy_model)
+        self.integrator.model = jit_model
+        self.assertTrue(self.integrator.numba_model)
+        right_increment = self.integrator._calc_increment(self.state)
+        returned_increment = self.integrator._calc_inc_numba(self.state)
+        np.testing.assert_almost_equal(returned_increment, right_increment)
+        np.testing.assert_almost_equal(
+            self.integrator.integrate(self.state),
+            self.state + right_increment
+        )
+
+    @unittest.skipIf(numba is None, 'numba is not installed!')
+    def test_rk4_numba_stepper_is_stored_per_model(self):
+        jit_model = numba.njit(dummy_model)
+        self.integrator.model = jit_model
+        self.integrator._calc_inc_numba(self.state)
+        stepper = self.integrator._numba_stepper
+        self.assertIs(stepper[0], jit_model)
+        self.integrator._calc_inc_numba(self.state)
+        self.assertIs(self.integrator._numba_stepper, stepper)
+        self.integrator.model = numba.njit(dummy_model)
+        self.integrator._calc_inc_numba(self.state)
+        self.assertIsNot(self.integrator._numba_stepper[1], stepper[1])
+
+    def test_rk4_numba_hook_equals_python_increment(self):
+        right_increment = self.integrator._calc_increment(self.state)
+        with patch('pytassim.model.integration.rk4._rk4_numba_stepper',
+                   new=_rk4_step_func), \
+                patch.object(RK4Integrator, 'numba_model',
+                             new_callable=PropertyMock, return_value=True):
+            returned_increment = self.integrator._calc_inc_numba(
+                self.state.astype(int)
+            )
+            int_state = self.integrator.integrate(self.state.astype(int))
+        self.assertEqual(returned_increment.dtype, np.float64)
+        np.testing.assert_almost_equal(returned_increment, right_increment)
+        np.testing.assert_almost_equal(int_state, self.state + right_increment)
+
+    @unittest.skipIf(numba is None, 'numba is not installed!')
+    def test_rk4_numba_promotes_integer_state(self):
+        self.integrator.model = numba.njit(dummy_model)
+        right_increment = self.integrator._calc_increment(self.state)
+        returned_increment = self.integrator._calc_inc_numba(
+            self.state.astype(int)
+        )
+        np.testing.assert_almost_equal(returned_increment, right_increment)
+
+    def test_rk4_python_model_is_not_numba(self):
+        self.assertFalse(self.integrator.numba_model)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -26,6 +26,7 @@ Created for torch-assimilate
 import unittest
 import logging
 import os
+import copy
 
 # External modules
 import xarray as xr
@@ -40,15 +41,25 @@ logging.basicConfig(level=logging.INFO)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
+STATE_PATH = os.path.join(DATA_PATH, 'test_state.nc')
+OBS_PATH = os.path.join(DATA_PATH, 'test_single_obs.nc')
 
 
 class TestIdentityOps(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._state = xr.open_dataarray(STATE_PATH).load()
+        cls._obs = xr.open_dataset(OBS_PATH).load()
+        torch_state_x = torch.from_numpy(cls._state.sel(var_name='x').values)
+        cls._torch_state_x = torch_state_x.view(
+            -1, IdentityOperator().len_grid
+        ).float().clone()
+        cls._operator_template = IdentityOperator()
+
     def setUp(self):
-        state_path = os.path.join(DATA_PATH, 'test_state.nc')
-        self.state = xr.open_dataarray(state_path)
-        obs_path = os.path.join(DATA_PATH, 'test_single_obs.nc')
-        self.obs = xr.open_dataset(obs_path)
-        self.operator = IdentityOperator()
+        self.state = self._state.copy(deep=True)
+        self.obs = self._obs.copy(deep=True)
+        self.operator = copy.copy(self._operator_template)
 
     def test_obs_points_returns_priv_obs_points(self):
         self.assertNotEqual(self.operator.obs_points, 10)
@@ -68,8 +79,11 @@ class TestIdentityOps(unittest.TestCase):
     def test_obs_points_sets_np_arange_if_none(self):
         self.operator._obs_points = None
         self.operator.obs_points = None
-        np.testing.assert_equal(self.operator._sel_obs_points,
-                                np.arange(self.operator.len_grid),)
+        sel_obs_points = self.operator._sel_obs_points
+        self.assertTrue(np.array_equal(
+            sel_obs_points,
+            np.arange(self.operator.len_grid, dtype=sel_obs_points.dtype)
+        ))
 
     def test_obs_points_sets_random(self):
         rnd = np.random.RandomState(10)
@@ -98,9 +112,7 @@ class TestIdentityOps(unittest.TestCase):
         pseudo_obs = pseudo_obs.values.reshape(-1, 3)
 
         torch_op = self.operator.torch_operator()
-        torch_state = torch.from_numpy(self.state.sel(var_name='x').values)
-        torch_state = torch_state.view(-1, self.operator.len_grid).float()
-        ret_obs = torch_op(torch_state).numpy()
+        ret_obs = torch_op(self._torch_state_x).numpy()
 
         np.testing.assert_almost_equal(ret_obs, pseudo_obs)
 
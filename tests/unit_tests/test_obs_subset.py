@@ -37,21 +37,26 @@ from pytassim.observation import Observation
 from pytassim.testing import dummy_obs_operator
 
 
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.WARNING)
 
 BASE_PATH = os.path.dirname(os.path.realpath(__file__))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
+OBS_PATH = os.path.join(DATA_PATH, 'test_single_obs.nc')
+STATE_PATH = os.path.join(DATA_PATH, 'test_state.nc')
 
 
 rnd = np.random.RandomState(42)
 
 
 class TestObsSubset(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._template_ds = xr.open_dataset(OBS_PATH).load()
+        cls._state = xr.open_dataarray(STATE_PATH).load()
+
     def setUp(self):
-        obs_path = os.path.join(DATA_PATH, 'test_single_obs.nc')
-        self.obs_ds = xr.open_dataset(obs_path)
-        state_path = os.path.join(DATA_PATH, 'test_state.nc')
-        self.state = xr.open_dataarray(state_path)
+        self.obs_ds = self._template_ds.copy(deep=True)
+        self.state = self._state.copy(deep=True)
 
     def test_xr_dataset_has_accessor(self):
         self.assertTrue(hasattr(self.obs_ds, 'obs'))
@@ -92,12 +97,10 @@ class TestObsSubset(unittest.TestCase):
 
     def test_valid_cov_checks_last_shape_of_dims(self):
         self.assertTrue(self.obs_ds.obs._valid_cov_corr)
-        obs_ds = self.obs_ds.copy()
-        obs_ds = obs_ds.isel(obs_grid_2=slice(0, 2))
-        self.assertFalse(obs_ds.obs._valid_cov_corr)
-        obs_ds = self.obs_ds.copy()
-        obs_ds = obs_ds.isel(obs_grid_1=slice(0, 2))
-        self.assertFalse(obs_ds.obs._valid_cov_corr)
+        for dim in ('obs_grid_1', 'obs_grid_2'):
+            with self.subTest(dim=dim):
+                obs_ds = self.obs_ds.isel({dim: slice(0, 2)})
+                self.assertFalse(obs_ds.obs._valid_cov_corr)
 
     def test_valid_cov_checks_grid_dim_values(self):
         self.assertTrue(self.obs_ds.obs._valid_cov_corr)
@@ -156,21 +159,17 @@ class TestObsSubset(unittest.TestCase):
 
     def test_valid_arrays_checks_if_arrays_available(self):
         self.assertTrue(self.obs_ds.obs._valid_arrays)
-        obs_ds = self.obs_ds.copy()
-        del obs_ds['covariance']
-        self.assertFalse(obs_ds.obs._valid_arrays)
-        obs_ds = self.obs_ds.copy()
-        del obs_ds['observations']
-        self.assertFalse(obs_ds.obs._valid_arrays)
+        for var_name in ('covariance', 'observations'):
+            with self.subTest(var_name=var_name):
+                obs_ds = self.obs_ds.drop_vars(var_name)
+                self.assertFalse(obs_ds.obs._valid_arrays)
 
     def test_valid_arrays_checks_dims(self):
         self.assertTrue(self.obs_ds.obs._valid_arrays)
-        obs_ds = self.obs_ds.copy()
-        obs_ds = obs_ds.isel(obs_grid_1=slice(0, 2))
-        self.assertFalse(obs_ds.obs._valid_arrays)
-        obs_ds = self.obs_ds.copy()
-        obs_ds = obs_ds.isel(obs_grid_2=slice(0, 2))
-        self.assertFalse(obs_ds.obs._valid_arrays)
+        for dim in ('obs_grid_1', 'obs_grid_2'):
+            with self.subTest(dim=dim):
+                obs_ds = self.obs_ds.isel({dim: slice(0, 2)})
+                self.assertFalse(obs_ds.obs._valid_arrays)
 
     def test_valid_array_uses_uncorrelated_for_uncorrelated_cov(self):
         self.obs_ds['covariance'] = xr.DataArray(
@@ -254,6 +253,26 @@ class TestObsSubset(unittest.TestCase):
         ret_chol_inv = chunked_obs.obs._corr_chol_inverse.mean('time')
         xr.testing.assert_identical(chol_inv, ret_chol_inv)
 
+    def test_corr_chol_inverse_decomposes_different_time_blocks(self):
+        cov_values = self.obs_ds['covariance'].values
+        scaling = np.arange(1, len(self.obs_ds['time'])+1)[:, None, None]
+        cov_time = cov_values[None, :, :] * scaling
+        self.obs_ds['covariance'] = xr.DataArray(
+            cov_time,
+            coords=self.obs_ds.coords,
+            dims=['time', 'obs_grid_1', 'obs_grid_2']
+        )
+        chol_inv = np.linalg.inv(np.linalg.cholesky(cov_time))
+        ret_chol_inv = self.obs_ds.obs._corr_chol_inverse
+        np.testing.assert_allclose(ret_chol_inv, chol_inv, atol=1E-10)
+
+    def test_tril_inverse_inverts_stacked_cholesky_factors(self):
+        cov = rnd.normal(size=(3, 10, 10))
+        cov = cov @ cov.transpose(0, 2, 1) + np.eye(10)
+        chol = np.linalg.cholesky(cov)
+        ret_inv = self.obs_ds.obs._tril_inverse(chol)
+        np.testing.assert_allclose(ret_inv, np.linalg.inv(chol), atol=1E-10)
+
     def test_corr_chol_inverse_uses_r_cinv(self):
         self.obs_ds.obs._r_cinv = np.arange(10)
         np.testing.assert_array_equal(
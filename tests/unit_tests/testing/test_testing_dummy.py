@@ -38,19 +38,24 @@ from pytassim.interface.base import BaseAssimilation
 import pytassim.testing.dummy as utils
 
 
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.WARNING)
 rnd = np.random.RandomState(42)
 
 BASE_PATH = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DATA_PATH = os.path.join(os.path.dirname(BASE_PATH), 'data')
+STATE_PATH = os.path.join(DATA_PATH, 'test_state.nc')
+OBS_PATH = os.path.join(DATA_PATH, 'test_single_obs.nc')
 
 
 class TestTestingUtilities(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._state = xr.open_dataarray(STATE_PATH).load()
+        cls._obs = xr.open_dataset(OBS_PATH).load()
+
     def setUp(self):
-        state_path = os.path.join(DATA_PATH, 'test_state.nc')
-        self.state = xr.open_dataarray(state_path)
-        obs_path = os.path.join(DATA_PATH, 'test_single_obs.nc')
-        self.obs = xr.open_dataset(obs_path)
+        self.state = self._state.copy(deep=True)
+        self.obs = self._obs.copy(deep=True)
 
     def test_dummy_update_returns_sliced_date(self):
         assimilation = BaseAssimilation()
@@ -60,13 +65,15 @@ class TestTestingUtilities(unittest.TestCase):
             assimilation, self.state, self.obs, self.state, ana_time
         )
         self.assertIsInstance(returned_state, xr.DataArray)
+        self.assertEqual(sliced_state.shape, returned_state.shape)
         xr.testing.assert_equal(sliced_state, returned_state)
 
     def test_dummy_obs_operator_returns_pseudo_obs(self):
         pseudo_obs = self.state.sel(var_name='x')
         pseudo_obs = pseudo_obs.rename(grid='obs_grid_1')
-        pseudo_obs['time'] = self.obs.time.values
-        pseudo_obs['obs_grid_1'] = self.obs.obs_grid_1.values
+        pseudo_obs = pseudo_obs.assign_coords(
+            time=self.obs.time.data, obs_grid_1=self.obs.obs_grid_1.data
+        )
 
         returned_pseudo_obs = utils.dummy_obs_operator(self.obs, self.state)
 